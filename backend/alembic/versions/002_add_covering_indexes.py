@@ -0,0 +1,51 @@
+"""Add covering indexes for calendar sync and chat history
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-01-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def _create_indexes(concurrently: bool) -> None:
+    # Covering index for calendar sync lookups that only need the event ID
+    op.create_index(
+        'ix_tasks_id_calendar_event_id',
+        'tasks',
+        ['id', 'calendar_event_id'],
+        unique=False,
+        postgresql_concurrently=concurrently
+    )
+
+    # Descending index matching the chat history ORDER BY timestamp DESC
+    op.create_index(
+        'ix_chat_messages_timestamp_desc',
+        'chat_messages',
+        [sa.text('timestamp DESC')],
+        unique=False,
+        postgresql_concurrently=concurrently
+    )
+
+
+def upgrade() -> None:
+    context = op.get_context()
+    if context.dialect.name == 'postgresql':
+        # CONCURRENTLY avoids blocking writes while the indexes build, but
+        # cannot run inside the migration transaction
+        with context.autocommit_block():
+            _create_indexes(concurrently=True)
+    else:
+        _create_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_messages_timestamp_desc', table_name='chat_messages')
+    op.drop_index('ix_tasks_id_calendar_event_id', table_name='tasks')
@@ -0,0 +1,70 @@
+"""Add indexes backing the GET /tasks filter set
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-01-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def _create_btree_indexes(concurrently: bool) -> None:
+    # Composite indexes matching the status/priority filters + created_at sort
+    op.create_index(
+        'ix_tasks_status_created_at',
+        'tasks',
+        ['status', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_concurrently=concurrently
+    )
+    op.create_index(
+        'ix_tasks_priority_created_at',
+        'tasks',
+        ['priority', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_concurrently=concurrently
+    )
+    op.create_index(
+        'ix_tasks_category',
+        'tasks',
+        ['category'],
+        unique=False,
+        postgresql_concurrently=concurrently
+    )
+
+
+def upgrade() -> None:
+    context = op.get_context()
+    if context.dialect.name == 'postgresql':
+        # pg_trgm GIN indexes accelerate the ILIKE '%term%' title/description
+        # search, which a plain btree cannot serve
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        with context.autocommit_block():
+            _create_btree_indexes(concurrently=True)
+            op.execute(
+                'CREATE INDEX CONCURRENTLY ix_tasks_title_trgm '
+                'ON tasks USING gin (title gin_trgm_ops)'
+            )
+            op.execute(
+                'CREATE INDEX CONCURRENTLY ix_tasks_description_trgm '
+                'ON tasks USING gin (description gin_trgm_ops)'
+            )
+    else:
+        _create_btree_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    context = op.get_context()
+    if context.dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_tasks_description_trgm')
+        op.execute('DROP INDEX IF EXISTS ix_tasks_title_trgm')
+    op.drop_index('ix_tasks_category', table_name='tasks')
+    op.drop_index('ix_tasks_priority_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_status_created_at', table_name='tasks')
@@ -0,0 +1,39 @@
+"""Add keyset pagination index for the task listing
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-01-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def _create_index(concurrently: bool) -> None:
+    # Backs the (created_at DESC, id DESC) seek used by cursor pagination
+    op.create_index(
+        'ix_tasks_created_at_id',
+        'tasks',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_concurrently=concurrently
+    )
+
+
+def upgrade() -> None:
+    context = op.get_context()
+    if context.dialect.name == 'postgresql':
+        with context.autocommit_block():
+            _create_index(concurrently=True)
+    else:
+        _create_index(concurrently=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_created_at_id', table_name='tasks')
@@ -0,0 +1,64 @@
+"""Store task status and priority as native enums
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-01-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        # Other dialects render Enum as VARCHAR + CHECK anyway; nothing to gain
+        return
+
+    op.execute(
+        "CREATE TYPE task_status AS ENUM ('PENDING', 'IN_PROGRESS', 'COMPLETED')"
+    )
+    op.execute(
+        "CREATE TYPE task_priority AS ENUM ('LOW', 'MEDIUM', 'HIGH', 'URGENT')"
+    )
+    op.execute(
+        "ALTER TABLE tasks "
+        "ALTER COLUMN status DROP DEFAULT, "
+        "ALTER COLUMN status TYPE task_status USING status::task_status, "
+        "ALTER COLUMN status SET DEFAULT 'PENDING', "
+        "ALTER COLUMN status SET NOT NULL"
+    )
+    op.execute(
+        "ALTER TABLE tasks "
+        "ALTER COLUMN priority DROP DEFAULT, "
+        "ALTER COLUMN priority TYPE task_priority USING priority::task_priority, "
+        "ALTER COLUMN priority SET DEFAULT 'MEDIUM', "
+        "ALTER COLUMN priority SET NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        "ALTER TABLE tasks "
+        "ALTER COLUMN status DROP DEFAULT, "
+        "ALTER COLUMN status TYPE VARCHAR(20) USING status::text, "
+        "ALTER COLUMN status SET DEFAULT 'PENDING', "
+        "ALTER COLUMN status DROP NOT NULL"
+    )
+    op.execute(
+        "ALTER TABLE tasks "
+        "ALTER COLUMN priority DROP DEFAULT, "
+        "ALTER COLUMN priority TYPE VARCHAR(20) USING priority::text, "
+        "ALTER COLUMN priority SET DEFAULT 'MEDIUM', "
+        "ALTER COLUMN priority DROP NOT NULL"
+    )
+    op.execute('DROP TYPE task_priority')
+    op.execute('DROP TYPE task_status')
@@ -0,0 +1,44 @@
+"""Add generated tsvector column for task search
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-01-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    context = op.get_context()
+    if context.dialect.name != 'postgresql':
+        # Full-text search is Postgres-only; other dialects keep ILIKE
+        return
+
+    # Weighted title+description vector maintained by Postgres itself
+    op.execute(
+        "ALTER TABLE tasks ADD COLUMN search_tsv tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+        ") STORED"
+    )
+    with context.autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_tasks_search_tsv '
+            'ON tasks USING gin (search_tsv)'
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_tasks_search_tsv')
+    op.execute('ALTER TABLE tasks DROP COLUMN search_tsv')
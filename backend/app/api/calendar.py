@@ -1,14 +1,18 @@
 """
 Google Calendar API endpoints.
 """
+import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, Depends
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.services.calendar_service import calendar_service
+from app.models.database import Task as TaskModel
+from app.schemas.task import Task
+from app.services.calendar_service import GoogleCalendarService, get_calendar_service
 
 
 class AuthUrlResponse(BaseModel):
@@ -33,7 +37,10 @@ router = APIRouter(prefix="/calendar", tags=["calendar"])
 
 
 @router.get("/auth-url", response_model=AuthUrlResponse)
-async def get_auth_url(user_id: str = Query(..., description="User identifier")):
+async def get_auth_url(
+    user_id: str = Query(..., description="User identifier"),
+    service: GoogleCalendarService = Depends(get_calendar_service)
+):
     """
     Get Google Calendar OAuth2 authorization URL.
     
@@ -44,7 +51,7 @@ async def get_auth_url(user_id: str = Query(..., description="User identifier"))
         Authorization URL for Google Calendar access
     """
     try:
-        auth_url = calendar_service.get_auth_url(user_id)
+        auth_url = await asyncio.to_thread(service.get_auth_url, user_id)
         return AuthUrlResponse(
             auth_url=auth_url,
             message="Please visit this URL to authorize Google Calendar access"
@@ -56,7 +63,10 @@ async def get_auth_url(user_id: str = Query(..., description="User identifier"))
 
 
 @router.post("/auth-callback", response_model=AuthStatusResponse)
-async def handle_auth_callback(callback_data: CalendarAuthCallback):
+async def handle_auth_callback(
+    callback_data: CalendarAuthCallback,
+    service: GoogleCalendarService = Depends(get_calendar_service)
+):
     """
     Handle OAuth2 callback from Google.
     
@@ -67,7 +77,8 @@ async def handle_auth_callback(callback_data: CalendarAuthCallback):
         Authentication status
     """
     try:
-        success = calendar_service.handle_oauth_callback(
+        success = await asyncio.to_thread(
+            service.handle_oauth_callback,
             code=callback_data.code,
             state=callback_data.state
         )
@@ -87,7 +98,10 @@ async def handle_auth_callback(callback_data: CalendarAuthCallback):
 
 
 @router.get("/auth-status", response_model=AuthStatusResponse)
-async def get_auth_status(user_id: str = Query(..., description="User identifier")):
+async def get_auth_status(
+    user_id: str = Query(..., description="User identifier"),
+    service: GoogleCalendarService = Depends(get_calendar_service)
+):
     """
     Check Google Calendar authentication status for user.
     
@@ -98,7 +112,7 @@ async def get_auth_status(user_id: str = Query(..., description="User identifier
         Current authentication status
     """
     try:
-        is_authenticated = calendar_service.is_authenticated(user_id)
+        is_authenticated = await asyncio.to_thread(service.is_authenticated, user_id)
         
         return AuthStatusResponse(
             authenticated=is_authenticated,
@@ -109,7 +123,10 @@ async def get_auth_status(user_id: str = Query(..., description="User identifier
 
 
 @router.post("/test-connection", response_model=Dict[str, Any])
-async def test_connection(user_id: str = Query(..., description="User identifier")):
+async def test_connection(
+    user_id: str = Query(..., description="User identifier"),
+    service: GoogleCalendarService = Depends(get_calendar_service)
+):
     """
     Test connection to Google Calendar API.
     
@@ -120,7 +137,7 @@ async def test_connection(user_id: str = Query(..., description="User identifier
         Connection test results
     """
     try:
-        connection_ok = calendar_service.test_connection(user_id)
+        connection_ok = await asyncio.to_thread(service.test_connection, user_id)
         
         if connection_ok:
             return {
@@ -137,7 +154,10 @@ async def test_connection(user_id: str = Query(..., description="User identifier
 
 
 @router.delete("/revoke-access", response_model=AuthStatusResponse)
-async def revoke_access(user_id: str = Query(..., description="User identifier")):
+async def revoke_access(
+    user_id: str = Query(..., description="User identifier"),
+    service: GoogleCalendarService = Depends(get_calendar_service)
+):
     """
     Revoke Google Calendar access for user.
     
@@ -148,7 +168,7 @@ async def revoke_access(user_id: str = Query(..., description="User identifier")
         Revocation status
     """
     try:
-        success = calendar_service.revoke_access(user_id)
+        success = await asyncio.to_thread(service.revoke_access, user_id)
         
         if success:
             return AuthStatusResponse(
@@ -187,11 +207,16 @@ class CalendarEventResponse(BaseModel):
     task_id: Optional[int] = None
 
 
+# Built once at import so event lists validate in a single compiled call
+_calendar_event_list_adapter = TypeAdapter(List[CalendarEventResponse])
+
+
 @router.post("/sync-task", response_model=SyncTaskResponse)
 async def sync_task_to_calendar(
     task_id: int,
     user_id: str = Query(..., description="User identifier"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    service: GoogleCalendarService = Depends(get_calendar_service)
 ):
     """
     Sync a task to Google Calendar.
@@ -205,26 +230,27 @@ async def sync_task_to_calendar(
         Sync operation result
     """
     try:
-        # Import here to avoid circular imports
-        from app.models.database import Task as TaskModel
-        from app.schemas.task import Task
-        
         # Get the task from database
-        db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        result = await db.execute(select(TaskModel).where(TaskModel.id == task_id))
+        db_task = result.scalar_one_or_none()
         if not db_task:
             raise HTTPException(status_code=404, detail="Task not found")
-        
+
         # Convert to schema for calendar service
         task = Task.model_validate(db_task)
-        
+
         # Sync to calendar
-        event_id = calendar_service.sync_task_to_calendar(user_id, task)
-        
+        event_id = await service.async_sync_task_to_calendar(user_id, task)
+
         if event_id:
-            # Update task with calendar event ID
-            db_task.calendar_event_id = event_id
-            db.commit()
-            db.refresh(db_task)
+            # Update task with calendar event ID in a single statement; the
+            # response doesn't need the task back, so skip the refresh
+            await db.execute(
+                update(TaskModel)
+                .where(TaskModel.id == task_id)
+                .values(calendar_event_id=event_id)
+            )
+            await db.commit()
             
             return SyncTaskResponse(
                 success=True,
@@ -240,18 +266,88 @@ async def sync_task_to_calendar(
     except HTTPException:
         raise
     except Exception as e:
-        error_info = calendar_service.handle_calendar_api_error(e)
+        error_info = service.handle_calendar_api_error(e)
         raise HTTPException(
             status_code=500,
             detail=f"Calendar sync error: {error_info['message']}"
         )
 
 
+class SyncTasksRequest(BaseModel):
+    """Request model for batch syncing tasks to calendar."""
+    task_ids: List[int]
+
+
+class SyncTasksResponse(BaseModel):
+    """Response model for batch task sync."""
+    success: bool
+    message: str
+    synced: Dict[int, Optional[str]]
+
+
+@router.post("/sync-tasks", response_model=SyncTasksResponse)
+async def sync_tasks_to_calendar(
+    request: SyncTasksRequest,
+    user_id: str = Query(..., description="User identifier"),
+    db: AsyncSession = Depends(get_db),
+    service: GoogleCalendarService = Depends(get_calendar_service)
+):
+    """
+    Sync multiple tasks to Google Calendar in one batch request.
+
+    Args:
+        request: Batch sync request with task IDs
+        user_id: User identifier
+        db: Database session
+
+    Returns:
+        Per-task sync results
+    """
+    try:
+        # Get all requested tasks in one query
+        result = await db.execute(
+            select(TaskModel).where(TaskModel.id.in_(request.task_ids))
+        )
+        db_tasks = result.scalars().all()
+
+        if not db_tasks:
+            raise HTTPException(status_code=404, detail="No matching tasks found")
+
+        tasks = [Task.model_validate(db_task) for db_task in db_tasks]
+
+        # Sync all tasks in a single batch HTTP request
+        synced = await service.async_sync_tasks_to_calendar(user_id, tasks)
+
+        # Store the new event IDs
+        for db_task in db_tasks:
+            event_id = synced.get(db_task.id)
+            if event_id:
+                db_task.calendar_event_id = event_id
+        await db.commit()
+
+        synced_count = sum(1 for event_id in synced.values() if event_id)
+        return SyncTasksResponse(
+            success=synced_count > 0,
+            message=f"Synced {synced_count} of {len(tasks)} tasks to Google Calendar",
+            synced=synced
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        error_info = service.handle_calendar_api_error(e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Calendar batch sync error: {error_info['message']}"
+        )
+
+
 @router.delete("/remove-task/{task_id}")
 async def remove_task_from_calendar(
     task_id: int,
     user_id: str = Query(..., description="User identifier"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    service: GoogleCalendarService = Depends(get_calendar_service)
 ):
     """
     Remove a task from Google Calendar.
@@ -265,25 +361,26 @@ async def remove_task_from_calendar(
         Removal operation result
     """
     try:
-        # Import here to avoid circular imports
-        from app.models.database import Task as TaskModel
-        from app.schemas.task import Task
-        
         # Get the task from database
-        db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        result = await db.execute(select(TaskModel).where(TaskModel.id == task_id))
+        db_task = result.scalar_one_or_none()
         if not db_task:
             raise HTTPException(status_code=404, detail="Task not found")
-        
+
         # Convert to schema for calendar service
         task = Task.model_validate(db_task)
-        
+
         # Remove from calendar
-        success = calendar_service.remove_task_from_calendar(user_id, task)
-        
+        success = await service.async_remove_task_from_calendar(user_id, task)
+
         if success:
-            # Clear calendar event ID from task
-            db_task.calendar_event_id = None
-            db.commit()
+            # Clear calendar event ID from task in a single statement
+            await db.execute(
+                update(TaskModel)
+                .where(TaskModel.id == task_id)
+                .values(calendar_event_id=None)
+            )
+            await db.commit()
             
             return {"success": True, "message": "Task removed from Google Calendar"}
         else:
@@ -292,7 +389,7 @@ async def remove_task_from_calendar(
     except HTTPException:
         raise
     except Exception as e:
-        error_info = calendar_service.handle_calendar_api_error(e)
+        error_info = service.handle_calendar_api_error(e)
         raise HTTPException(
             status_code=500,
             detail=f"Calendar removal error: {error_info['message']}"
@@ -302,35 +399,36 @@ async def remove_task_from_calendar(
 @router.get("/events/{task_id}", response_model=List[CalendarEventResponse])
 async def get_calendar_events_for_task(
     task_id: int,
-    user_id: str = Query(..., description="User identifier")
+    user_id: str = Query(..., description="User identifier"),
+    db: AsyncSession = Depends(get_db),
+    service: GoogleCalendarService = Depends(get_calendar_service)
 ):
     """
     Get calendar events associated with a task.
-    
+
     Args:
         task_id: Task ID to get events for
         user_id: User identifier
-        
+        db: Database session
+
     Returns:
         List of calendar events for the task
     """
     try:
-        events = calendar_service.get_calendar_events_for_task(user_id, task_id)
-        
-        return [
-            CalendarEventResponse(
-                id=event.id,
-                summary=event.summary,
-                description=event.description,
-                start=event.start,
-                end=event.end,
-                task_id=event.task_id
-            )
-            for event in events
-        ]
+        # Tasks store their event ID; passing it lets the service do a
+        # direct event GET instead of a filtered calendar scan
+        calendar_event_id = await db.scalar(
+            select(TaskModel.calendar_event_id).where(TaskModel.id == task_id)
+        )
+
+        events = await service.async_get_calendar_events_for_task(
+            user_id, task_id, calendar_event_id
+        )
+
+        return _calendar_event_list_adapter.validate_python(events, from_attributes=True)
         
     except Exception as e:
-        error_info = calendar_service.handle_calendar_api_error(e)
+        error_info = service.handle_calendar_api_error(e)
         raise HTTPException(
             status_code=500,
             detail=f"Error getting calendar events: {error_info['message']}"
@@ -1,24 +1,47 @@
 """
 Chat and AI integration API endpoints.
 """
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.models.database import ChatMessage as ChatMessageModel, MessageRole, Task as TaskModel
 from app.schemas.chat import ChatMessage, ChatPromptRequest, ChatResponse
 from app.schemas.task import GeneratedTask, WorkloadAnalysis
-from app.services.ollama_service import ollama_service, OllamaConnectionError
-from app.utils.database import create_chat_message_from_schema
+from app.services.ollama_service import get_ollama_service, OllamaConnectionError
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Validates a whole page of ORM rows in one call instead of per-row
+# ChatMessage.model_validate in a Python loop
+_chat_message_list_adapter = TypeAdapter(List[ChatMessage])
+
+
+async def _estimate_total_messages(db: AsyncSession) -> int:
+    """
+    Estimate the chat message row count.
+
+    On PostgreSQL this reads the planner's reltuples statistic instead of
+    scanning the table; other dialects fall back to an exact COUNT.
+    """
+    if db.bind is not None and db.bind.dialect.name == "postgresql":
+        estimate = await db.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {"table": ChatMessageModel.__tablename__},
+        )
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+
+    return await db.scalar(select(func.count()).select_from(ChatMessageModel)) or 0
+
 
 @router.post("/generate-tasks")
 async def generate_tasks_from_prompt(
     request: ChatPromptRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Generate tasks from natural language prompt using AI.
@@ -30,51 +53,50 @@ async def generate_tasks_from_prompt(
     Returns:
         Chat response with generated tasks
     """
-    # Check if Ollama is available
-    if not await ollama_service.check_connection():
+    ollama_service = get_ollama_service()
+
+    # The background refresher keeps this flag current; no per-request probe
+    if not ollama_service.is_healthy:
         raise HTTPException(
-            status_code=503, 
+            status_code=503,
             detail="AI service is currently unavailable. Please try again later."
         )
-    
+
+
     try:
         # Store user message
-        user_message_data = {
-            'content': request.prompt,
-            'role': MessageRole.USER
-        }
         user_message = ChatMessageModel(
             content=request.prompt,
             role=MessageRole.USER.value
         )
-        db.add(user_message)
-        db.commit()
-        db.refresh(user_message)
-        
+
         # Generate tasks using AI
         generated_tasks = await ollama_service.generate_tasks_from_prompt(request.prompt)
-        
+
         # Create assistant response message
         assistant_content = f"I've generated {len(generated_tasks)} tasks based on your request."
         if request.context:
             assistant_content += f" Context considered: {request.context}"
-        
+
         # Convert generated tasks to dict for JSON storage
         tasks_data = [task.model_dump(mode='json') for task in generated_tasks]
-        
+
         assistant_message = ChatMessageModel(
             content=assistant_content,
             role=MessageRole.ASSISTANT.value,
             generated_tasks=tasks_data
         )
-        db.add(assistant_message)
-        db.commit()
-        db.refresh(assistant_message)
+
+        # Persist both sides of the exchange in a single transaction
+        db.add_all([user_message, assistant_message])
+        await db.commit()
+        await db.refresh(assistant_message)
         
-        # Create response data
+        # Create response data, reusing the already-dumped task dicts instead
+        # of serializing every generated task a second time
         response_data = {
             "message": ChatMessage.model_validate(assistant_message).model_dump(),
-            "generated_tasks": [task.model_dump() for task in generated_tasks]
+            "generated_tasks": tasks_data
         }
         
         # Return wrapped response
@@ -87,7 +109,7 @@ async def generate_tasks_from_prompt(
     except OllamaConnectionError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to generate tasks: {str(e)}")
 
 
@@ -95,41 +117,66 @@ async def generate_tasks_from_prompt(
 async def get_chat_messages(
     page: int = 1,
     size: int = 50,
-    db: Session = Depends(get_db)
+    before_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get chat message history with pagination.
-    
+
     Args:
         page: Page number (1-based)
         size: Number of messages per page
+        before_id: Optional keyset cursor; return messages older than this ID
         db: Database session
-        
+
     Returns:
         Paginated response with chat messages
     """
     try:
         # Calculate offset from page number
         offset = (page - 1) * size
-        
-        # Get total count
-        total = db.query(ChatMessageModel).count()
-        
-        # Get messages for the current page
-        messages = (
-            db.query(ChatMessageModel)
-            .order_by(ChatMessageModel.timestamp.desc())
-            .offset(offset)
+
+        # Single windowed query: page of messages plus total count, instead
+        # of a separate COUNT round-trip per request
+        query = select(ChatMessageModel, func.count().over().label("total"))
+
+        if before_id is not None:
+            # Keyset pagination: seek directly past the cursor instead of
+            # scanning and discarding OFFSET rows
+            query = query.where(ChatMessageModel.id < before_id)
+        else:
+            query = query.offset(offset)
+
+        # Stream rows through a server-side cursor instead of buffering the
+        # whole result set in the driver before handing it over
+        result = await db.stream(
+            query.order_by(ChatMessageModel.timestamp.desc())
             .limit(size)
-            .all()
+            .execution_options(yield_per=50)
         )
+
+        messages = []
+        total = None
+        async for row in result:
+            if total is None:
+                total = row.total
+            messages.append(row[0])
+
+        if total is None and (page > 1 or before_id is not None):
+            # Page past the end: fall back to an estimate so metadata stays
+            # reasonable without a full table scan
+            total = await _estimate_total_messages(db)
+        elif total is None:
+            total = 0
         
         # Calculate total pages
         pages = (total + size - 1) // size if total > 0 else 1
         
         # Return paginated response wrapped in ApiResponse format
         paginated_data = {
-            "items": [ChatMessage.model_validate(msg) for msg in messages],
+            "items": _chat_message_list_adapter.validate_python(
+                messages, from_attributes=True
+            ),
             "total": total,
             "page": page,
             "size": size,
@@ -147,16 +194,20 @@ async def get_chat_messages(
 
 
 @router.delete("/messages", status_code=204)
-async def clear_chat_history(db: Session = Depends(get_db)):
+async def clear_chat_history(db: AsyncSession = Depends(get_db)):
     """
     Clear all chat message history.
-    
+
     Args:
         db: Database session
     """
     try:
-        db.query(ChatMessageModel).delete()
-        db.commit()
+        if db.bind is not None and db.bind.dialect.name == "postgresql":
+            # TRUNCATE reclaims the table in O(1) instead of scanning rows
+            await db.execute(text(f"TRUNCATE TABLE {ChatMessageModel.__tablename__}"))
+        else:
+            await db.execute(delete(ChatMessageModel))
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to clear chat history: {str(e)}")
\ No newline at end of file
@@ -1,24 +1,72 @@
 """
 Task CRUD API endpoints.
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional, Tuple
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import and_, delete, func, lambda_stmt, literal_column, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import cache
 from app.core.database import get_db
 from app.models.database import Task as TaskModel, TaskStatus, Priority
-from app.schemas.task import Task, TaskCreate, TaskUpdate, TaskFilters, WorkloadAnalysis
-from app.services.ollama_service import ollama_service, OllamaConnectionError
+from app.schemas.task import (
+    Task,
+    TaskCreate,
+    TaskUpdate,
+    TaskFilters,
+    TaskListItem,
+    TaskPage,
+    WorkloadAnalysis,
+)
+from app.services.ollama_service import get_ollama_service, OllamaConnectionError
 from app.utils.database import create_task_from_schema, update_task_from_schema
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Built once at import time; validates whole result sets in a single
+# pydantic-core call instead of one model_validate per row
+TASKS_ADAPTER = TypeAdapter(List[TaskListItem])
+
+# Only the columns the list page renders — skips description/calendar_event_id
+# and ORM instance construction entirely
+TASK_LIST_COLUMNS = (
+    TaskModel.id,
+    TaskModel.title,
+    TaskModel.status,
+    TaskModel.priority,
+    TaskModel.category,
+    TaskModel.due_date,
+    TaskModel.created_at,
+    TaskModel.updated_at,
+    TaskModel.ai_generated,
+)
+
+
+def _encode_cursor(created_at: datetime, task_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    return base64.urlsafe_b64encode(
+        f"{created_at.isoformat()}|{task_id}".encode()
+    ).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode an opaque cursor back into its (created_at, id) position."""
+    try:
+        created_at_raw, task_id_raw = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at_raw), int(task_id_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 @router.post("/", response_model=Task, status_code=201)
 async def create_task(
     task_data: TaskCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new task.
@@ -31,68 +79,114 @@ async def create_task(
         Created task
     """
     try:
-        db_task = create_task_from_schema(db, task_data)
+        db_task = await create_task_from_schema(db, task_data)
+        await cache.cache_delete(cache.WORKLOAD_ANALYSIS_KEY)
         return Task.model_validate(db_task)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create task: {str(e)}")
 
 
-@router.get("/", response_model=List[Task])
+@router.get("/", response_model=TaskPage)
 async def get_tasks(
     status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
     priority: Optional[Priority] = Query(None, description="Filter by task priority"),
     category: Optional[str] = Query(None, description="Filter by task category"),
     search: Optional[str] = Query(None, description="Search in title and description"),
-    skip: int = Query(0, ge=0, description="Number of tasks to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of tasks to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Get tasks with optional filtering and pagination.
-    
+    Get tasks with optional filtering and keyset pagination.
+
     Args:
         status: Filter by task status
         priority: Filter by task priority
         category: Filter by task category
         search: Search term for title and description
-        skip: Number of tasks to skip for pagination
+        cursor: Opaque cursor returned by the previous page
         limit: Maximum number of tasks to return
         db: Database session
-        
+
     Returns:
-        List of tasks matching the criteria
+        Page of tasks matching the criteria plus a cursor for the next page
     """
+    cursor_position = _decode_cursor(cursor) if cursor else None
     try:
-        query = db.query(TaskModel)
-        
-        # Apply filters
-        filters = []
-        
+        # lambda_stmt gives each filter branch a stable compilation-cache key,
+        # so repeated requests reuse the compiled SQL instead of rebuilding it
+        query = lambda_stmt(lambda: select(*TASK_LIST_COLUMNS))
+
         if status:
-            filters.append(TaskModel.status == status.value)
-        
+            query += lambda s: s.where(TaskModel.status == status)
+
         if priority:
-            filters.append(TaskModel.priority == priority.value)
-            
+            query += lambda s: s.where(TaskModel.priority == priority)
+
         if category:
-            filters.append(TaskModel.category == category)
-            
-        if search:
+            query += lambda s: s.where(TaskModel.category == category)
+
+        # Full-text search hits the GIN-indexed search_tsv generated column on
+        # Postgres (weighted title over description); other dialects keep ILIKE
+        use_fts = bool(search) and db.bind.dialect.name == "postgresql"
+        if use_fts:
+            query += lambda s: s.where(
+                literal_column("search_tsv").op("@@")(
+                    func.plainto_tsquery("english", search)
+                )
+            )
+        elif search:
             search_term = f"%{search}%"
-            filters.append(
+            query += lambda s: s.where(
                 or_(
                     TaskModel.title.ilike(search_term),
                     TaskModel.description.ilike(search_term)
                 )
             )
-        
-        if filters:
-            query = query.filter(and_(*filters))
-        
-        # Apply pagination and ordering
-        tasks = query.order_by(TaskModel.created_at.desc()).offset(skip).limit(limit).all()
-        
-        return [Task.model_validate(task) for task in tasks]
+
+        # Keyset pagination: seek past the previous page's last row instead of
+        # counting and discarding OFFSET rows
+        if cursor_position:
+            cursor_created_at, cursor_id = cursor_position
+            query += lambda s: s.where(
+                or_(
+                    TaskModel.created_at < cursor_created_at,
+                    and_(
+                        TaskModel.created_at == cursor_created_at,
+                        TaskModel.id < cursor_id,
+                    ),
+                )
+            )
+
+        if use_fts:
+            # Rank matches best-first; relevance order is not a stable keyset
+            query += lambda s: s.order_by(
+                func.ts_rank_cd(
+                    literal_column("search_tsv"),
+                    func.plainto_tsquery("english", search),
+                ).desc(),
+                TaskModel.created_at.desc(),
+                TaskModel.id.desc(),
+            ).limit(limit)
+        else:
+            query += lambda s: s.order_by(
+                TaskModel.created_at.desc(), TaskModel.id.desc()
+            ).limit(limit)
+
+        result = await db.execute(query)
+        tasks = result.all()
+
+        next_cursor = None
+        if len(tasks) == limit and not use_fts:
+            next_cursor = _encode_cursor(tasks[-1].created_at, tasks[-1].id)
+
+        page = TaskPage(
+            tasks=TASKS_ADAPTER.validate_python(tasks, from_attributes=True),
+            next_cursor=next_cursor
+        )
+        # Serialize in one pydantic-core call, bypassing jsonable_encoder's
+        # per-field Python walk of the page
+        return Response(content=page.model_dump_json(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve tasks: {str(e)}")
 
@@ -100,7 +194,7 @@ async def get_tasks(
 @router.get("/{task_id}", response_model=Task)
 async def get_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get a specific task by ID.
@@ -112,19 +206,28 @@ async def get_task(
     Returns:
         Task details
     """
-    db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-    
+    cached = await cache.cache_get(cache.task_key(task_id))
+    if cached is not None:
+        return Task.model_validate_json(cached)
+
+    result = await db.execute(select(TaskModel).where(TaskModel.id == task_id))
+    db_task = result.scalar_one_or_none()
+
     if not db_task:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    return Task.model_validate(db_task)
+
+    task = Task.model_validate(db_task)
+    await cache.cache_set(
+        cache.task_key(task_id), task.model_dump_json(), cache.TASK_TTL_SECONDS
+    )
+    return task
 
 
 @router.put("/{task_id}", response_model=Task)
 async def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update a task completely.
@@ -137,13 +240,15 @@ async def update_task(
     Returns:
         Updated task
     """
-    db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+    result = await db.execute(select(TaskModel).where(TaskModel.id == task_id))
+    db_task = result.scalar_one_or_none()
     
     if not db_task:
         raise HTTPException(status_code=404, detail="Task not found")
     
     try:
-        updated_task = update_task_from_schema(db, db_task, task_update)
+        updated_task = await update_task_from_schema(db, task_id, task_update)
+        await cache.invalidate_task(task_id)
         return Task.model_validate(updated_task)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update task: {str(e)}")
@@ -152,7 +257,7 @@ async def update_task(
 @router.patch("/{task_id}/complete", response_model=Task)
 async def mark_task_complete(
     task_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Mark a task as completed.
@@ -164,25 +269,35 @@ async def mark_task_complete(
     Returns:
         Updated task with completed status
     """
-    db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-    
-    if not db_task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
     try:
-        db_task.status = TaskStatus.COMPLETED.value
-        db.commit()
-        db.refresh(db_task)
+        # Single UPDATE ... RETURNING round-trip; rowcount doubles as the
+        # existence check
+        result = await db.execute(
+            update(TaskModel)
+            .where(TaskModel.id == task_id)
+            .values(status=TaskStatus.COMPLETED, updated_at=func.now())
+            .returning(TaskModel)
+        )
+        db_task = result.scalar_one_or_none()
+
+        if not db_task:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        await db.commit()
+        await cache.invalidate_task(task_id)
         return Task.model_validate(db_task)
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to mark task as complete: {str(e)}")
 
 
 @router.delete("/{task_id}", status_code=204)
 async def delete_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a task.
@@ -191,22 +306,82 @@ async def delete_task(
         task_id: Task ID
         db: Database session
     """
-    db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-    
-    if not db_task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
     try:
-        db.delete(db_task)
-        db.commit()
+        # Single DELETE round-trip; no SELECT needed to detect a missing row
+        result = await db.execute(delete(TaskModel).where(TaskModel.id == task_id))
+
+        if result.rowcount == 0:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        await db.commit()
+        await cache.invalidate_task(task_id)
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete task: {str(e)}")
 
 
+async def _aggregate_task_stats(db: AsyncSession) -> Tuple[dict, List[dict]]:
+    """
+    Aggregate workload counts in SQL instead of shipping the whole task
+    table through Python.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Tuple of (stats dict, small sample of recent task dicts)
+    """
+    total_tasks = await db.scalar(select(func.count()).select_from(TaskModel)) or 0
+
+    status_rows = await db.execute(
+        select(TaskModel.status, func.count()).group_by(TaskModel.status)
+    )
+    tasks_by_status = dict(status_rows.all())
+    completed_tasks = tasks_by_status.get(TaskStatus.COMPLETED, 0)
+    pending_tasks = total_tasks - completed_tasks
+
+    overdue_tasks = await db.scalar(
+        select(func.count())
+        .select_from(TaskModel)
+        .where(
+            TaskModel.due_date < func.now(),
+            TaskModel.status != TaskStatus.COMPLETED,
+        )
+    ) or 0
+
+    priority_rows = await db.execute(
+        select(TaskModel.priority, func.count()).group_by(TaskModel.priority)
+    )
+    tasks_by_priority = {priority: 0 for priority in Priority}
+    for priority, count in priority_rows.all():
+        try:
+            tasks_by_priority[Priority(priority)] += count
+        except ValueError:
+            tasks_by_priority[Priority.MEDIUM] += count
+
+    # Small sample of recent tasks for prompt context
+    recent_rows = await db.execute(
+        select(TaskModel.title, TaskModel.status, TaskModel.priority)
+        .order_by(TaskModel.created_at.desc())
+        .limit(5)
+    )
+    recent_tasks = [dict(row._mapping) for row in recent_rows.all()]
+
+    return {
+        'total_tasks': total_tasks,
+        'completed_tasks': completed_tasks,
+        'pending_tasks': pending_tasks,
+        'overdue_tasks': overdue_tasks,
+        'tasks_by_priority': tasks_by_priority,
+    }, recent_tasks
+
+
 @router.post("/analyze", response_model=WorkloadAnalysis)
 async def analyze_workload(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Analyze current workload and provide AI-powered insights.
@@ -217,37 +392,34 @@ async def analyze_workload(
     Returns:
         Workload analysis with recommendations
     """
-    # Check if Ollama is available
-    if not await ollama_service.check_connection():
+    # Serve a recent analysis from cache before touching the DB or the LLM
+    cached = await cache.cache_get(cache.WORKLOAD_ANALYSIS_KEY)
+    if cached is not None:
+        return WorkloadAnalysis.model_validate_json(cached)
+
+    ollama_service = get_ollama_service()
+
+    # The background refresher keeps this flag current; no per-request probe
+    if not ollama_service.is_healthy:
         raise HTTPException(
-            status_code=503, 
+            status_code=503,
             detail="AI service is currently unavailable. Please try again later."
         )
-    
+
     try:
-        # Get all tasks for analysis
-        tasks = db.query(TaskModel).all()
-        
-        # Convert to dict format for AI analysis
-        tasks_data = []
-        for task in tasks:
-            task_dict = {
-                'id': task.id,
-                'title': task.title,
-                'description': task.description,
-                'status': task.status,
-                'priority': task.priority,
-                'due_date': task.due_date.isoformat() if task.due_date else None,
-                'category': task.category,
-                'created_at': task.created_at.isoformat(),
-                'ai_generated': task.ai_generated
-            }
-            tasks_data.append(task_dict)
-        
+        stats, recent_tasks = await _aggregate_task_stats(db)
+
         # Get AI analysis
-        analysis = await ollama_service.analyze_workload(tasks_data)
+        analysis = await ollama_service.analyze_workload_from_stats(stats, recent_tasks)
+        await cache.cache_set(
+            cache.WORKLOAD_ANALYSIS_KEY,
+            analysis.model_dump_json(),
+            cache.WORKLOAD_ANALYSIS_TTL_SECONDS,
+        )
         return analysis
         
+    except HTTPException:
+        raise
     except OllamaConnectionError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
@@ -257,7 +429,7 @@ async def analyze_workload(
 @router.post("/{task_id}/improve")
 async def improve_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Improve task description using AI suggestions.
@@ -269,14 +441,17 @@ async def improve_task(
     Returns:
         Task with improved description
     """
-    # Check if Ollama is available
-    if not await ollama_service.check_connection():
+    ollama_service = get_ollama_service()
+
+    # The background refresher keeps this flag current; no per-request probe
+    if not ollama_service.is_healthy:
         raise HTTPException(
-            status_code=503, 
+            status_code=503,
             detail="AI service is currently unavailable. Please try again later."
         )
-    
-    db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+
+    result = await db.execute(select(TaskModel).where(TaskModel.id == task_id))
+    db_task = result.scalar_one_or_none()
     
     if not db_task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -284,13 +459,20 @@ async def improve_task(
     try:
         # Get improved description from AI
         current_description = db_task.description or db_task.title
-        improved_description = await ollama_service.improve_task_description(current_description)
-        
-        # Update task with improved description
-        db_task.description = improved_description
-        db.commit()
-        db.refresh(db_task)
-        
+        improved_description = await ollama_service.improve_task_description_batched(current_description)
+
+        # Write and re-read in one UPDATE ... RETURNING round-trip; no
+        # post-commit refresh needed for server-updated columns
+        result = await db.execute(
+            update(TaskModel)
+            .where(TaskModel.id == task_id)
+            .values(description=improved_description, updated_at=func.now())
+            .returning(TaskModel)
+        )
+        db_task = result.scalar_one()
+        await db.commit()
+        await cache.invalidate_task(task_id)
+
         return {
             "task": Task.model_validate(db_task),
             "original_description": current_description,
@@ -300,5 +482,5 @@ async def improve_task(
     except OllamaConnectionError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to improve task: {str(e)}")
\ No newline at end of file
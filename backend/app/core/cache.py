@@ -0,0 +1,84 @@
+"""
+Redis cache helpers for hot-path API responses.
+"""
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache key layout and TTLs
+TASK_KEY_TEMPLATE = "task:{task_id}"
+TASK_TTL_SECONDS = 300
+WORKLOAD_ANALYSIS_KEY = "workload_analysis:v1"
+WORKLOAD_ANALYSIS_TTL_SECONDS = 60
+
+redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+def task_key(task_id: int) -> str:
+    """Build the cache key for a single task."""
+    return TASK_KEY_TEMPLATE.format(task_id=task_id)
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """
+    Get a cached value, treating an unavailable Redis as a miss.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached JSON string, or None on miss or Redis failure
+    """
+    try:
+        return await redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+async def cache_set(key: str, value: str, ttl: int) -> None:
+    """
+    Store a value with a TTL, ignoring an unavailable Redis.
+
+    Args:
+        key: Cache key
+        value: JSON string to store
+        ttl: Expiry in seconds
+    """
+    try:
+        await redis_client.set(key, value, ex=ttl)
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Delete cache keys, ignoring an unavailable Redis.
+
+    Args:
+        keys: Cache keys to invalidate
+    """
+    if not keys:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Cache invalidation failed for {keys}: {e}")
+
+
+async def invalidate_task(task_id: int) -> None:
+    """Invalidate a task's cache entry plus the derived workload analysis."""
+    await cache_delete(task_key(task_id), WORKLOAD_ANALYSIS_KEY)
+
+
+async def close_cache() -> None:
+    """Close the Redis connection pool."""
+    try:
+        await redis_client.aclose()
+    except redis.RedisError as e:
+        logger.warning(f"Error closing Redis connection: {e}")
@@ -1,8 +1,11 @@
 """
 Application configuration settings.
 """
+from functools import lru_cache
+from pathlib import Path
 from typing import List
-from pydantic_settings import BaseSettings
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -15,7 +18,13 @@ class Settings(BaseSettings):
     DATABASE_NAME: str = "ollama_todo"
     DATABASE_USER: str = "username"
     DATABASE_PASSWORD: str = "password"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 5
     
+    # Redis cache settings
+    REDIS_URL: str = "redis://localhost:6379/0"
+
     # Ollama settings
     OLLAMA_HOST: str = "http://localhost:11434"
     OLLAMA_MODEL: str = "llama2"
@@ -38,7 +47,25 @@ class Settings(BaseSettings):
         "http://127.0.0.1:4173"
     ]
     
-    model_config = {"env_file": ".env"}
+    # Only point pydantic-settings at .env when it exists, so containers
+    # configured purely via env vars skip the dotenv disk scan
+    model_config = SettingsConfigDict(
+        env_file=".env" if Path(".env").exists() else None,
+        env_file_encoding="utf-8",
+        frozen=True,
+        extra="ignore",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the shared Settings instance.
+
+    Caching avoids re-reading .env and re-running validation every time the
+    settings are constructed (e.g. in tests or per-worker imports).
+    """
+    return Settings()
 
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
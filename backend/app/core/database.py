@@ -1,12 +1,14 @@
 """
 Database connection utilities and session management.
 """
+import contextlib
 import logging
-from typing import Generator
+from typing import AsyncIterator
 
+import orjson
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
@@ -14,19 +16,62 @@ from app.models.database import Base
 
 logger = logging.getLogger(__name__)
 
-# Create database engine with connection pooling
+
+def _async_database_url(url: str) -> str:
+    """Map the configured database URL onto its async driver equivalent."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+def _json_serializer(obj) -> str:
+    """Serialize JSON column values with orjson instead of stdlib json."""
+    return orjson.dumps(obj).decode()
+
+
+# SQL statement logging goes through the logging config instead of echo=True,
+# which formats every statement into a log record even when nobody reads it
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if settings.DEBUG else logging.WARNING
+)
+
+# Synchronous engine used by Alembic, management scripts and schema operations
 engine = create_engine(
     settings.DATABASE_URL,
     poolclass=QueuePool,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=settings.DEBUG,
+    pool_recycle=1800,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
+
+# Async engine used by request handlers so DB I/O doesn't block the event loop.
+# The pool is sized for bursts of concurrent requests; pre-ping drops dead
+# connections before they fail a query, and the short pool_timeout makes pool
+# starvation fail fast instead of queueing indefinitely.
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args={"server_settings": {"application_name": "ollama-todo-api"}},
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 @event.listens_for(Engine, "connect")
@@ -37,32 +82,37 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
         pass
 
 
-def create_database():
-    """Create all database tables."""
+def create_database(bind=None):
+    """Create all database tables, optionally against a caller-supplied engine."""
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=bind if bind is not None else engine)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
         raise
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Dependency to get database session.
-    
+
     Yields:
-        Session: SQLAlchemy database session
+        AsyncSession: SQLAlchemy async database session
     """
     db = SessionLocal()
     try:
         yield db
     except Exception as e:
         logger.error(f"Database session error: {e}")
-        db.rollback()
+        await db.rollback()
         raise
     finally:
-        db.close()
+        await db.close()
+
+
+# get_db wrapped for non-FastAPI call sites (scripts, tests):
+# ``async with get_db_context() as db``
+get_db_context = contextlib.asynccontextmanager(get_db)
 
 
 def check_database_connection() -> bool:
@@ -83,10 +133,29 @@ def check_database_connection() -> bool:
         return False
 
 
+async def check_database_connection_async() -> bool:
+    """
+    Check the async engine's database connection without blocking the loop.
+
+    Returns:
+        bool: True if connection is successful, False otherwise
+    """
+    try:
+        from sqlalchemy import text
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        logger.info("Database connection successful")
+        return True
+    except Exception as e:
+        logger.error(f"Database connection failed: {e}")
+        return False
+
+
 def close_database_connections():
     """Close all database connections."""
     try:
         engine.dispose()
+        async_engine.sync_engine.dispose()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error closing database connections: {e}")
\ No newline at end of file
@@ -5,9 +5,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, Index
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.sql import func
+from sqlalchemy.sql import desc, func
 
 Base = declarative_base()
 
@@ -48,14 +49,33 @@ class Task(Base):
     """Task model for storing todo items."""
     
     __tablename__ = "tasks"
-    
+    __table_args__ = (
+        # Covering index for calendar sync lookups that only need the event ID
+        Index("ix_tasks_id_calendar_event_id", "id", "calendar_event_id"),
+        # Composite indexes matching the GET /tasks filters + created_at sort;
+        # their leading columns also serve plain status/priority lookups
+        Index("ix_tasks_status_created_at", "status", desc("created_at")),
+        Index("ix_tasks_priority_created_at", "priority", desc("created_at")),
+        # Keyset pagination seek path for the default task listing order
+        Index("ix_tasks_created_at_id", desc("created_at"), desc("id")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     due_date = Column(DateTime, nullable=True)
-    priority = Column(String(20), default=Priority.MEDIUM.value)
-    category = Column(String(100), nullable=True)
-    status = Column(String(20), default=TaskStatus.PENDING.value)
+    # Native enums: 4-byte comparisons and smaller index leaves than VARCHAR
+    priority = Column(
+        SQLEnum(Priority, name="task_priority"),
+        default=Priority.MEDIUM,
+        nullable=False,
+    )
+    category = Column(String(100), nullable=True, index=True)
+    status = Column(
+        SQLEnum(TaskStatus, name="task_status"),
+        default=TaskStatus.PENDING,
+        nullable=False,
+    )
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     calendar_event_id = Column(String(255), nullable=True)
@@ -66,7 +86,11 @@ class ChatMessage(Base):
     """Chat message model for storing conversation history."""
     
     __tablename__ = "chat_messages"
-    
+    __table_args__ = (
+        # Matches the chat history ORDER BY timestamp DESC
+        Index("ix_chat_messages_timestamp_desc", desc("timestamp")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
     role = Column(String(20), nullable=False)
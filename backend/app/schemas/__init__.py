@@ -8,7 +8,9 @@ from .task import (
     TaskFilters,
     GeneratedTask,
     WorkloadAnalysis,
-    TaskInDB
+    TaskInDB,
+    TaskListItem,
+    TaskPage
 )
 from .chat import (
     ChatMessage,
@@ -35,6 +37,8 @@ __all__ = [
     "GeneratedTask",
     "WorkloadAnalysis",
     "TaskInDB",
+    "TaskListItem",
+    "TaskPage",
     # Chat schemas
     "ChatMessage",
     "ChatMessageCreate",
@@ -71,6 +71,29 @@ class Task(TaskBase):
     model_config = {"from_attributes": True}
 
 
+class TaskListItem(BaseModel):
+    """Narrow task schema for list pages, omitting heavyweight detail fields."""
+    id: int
+    title: str
+    status: TaskStatus
+    priority: Priority
+    category: Optional[str] = None
+    due_date: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    ai_generated: bool
+
+    model_config = {"from_attributes": True}
+
+
+class TaskPage(BaseModel):
+    """Schema for a keyset-paginated page of tasks."""
+    tasks: List[TaskListItem] = Field(..., description="Tasks in this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, null on the last page"
+    )
+
+
 class TaskInDB(Task):
     """Schema for task as stored in database."""
     pass
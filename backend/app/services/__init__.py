@@ -1,4 +1,11 @@
 # Business logic services
-from .ollama_service import ollama_service
+from .ollama_service import get_ollama_service
 
-__all__ = ['ollama_service']
\ No newline at end of file
+__all__ = ['get_ollama_service', 'ollama_service']
+
+
+def __getattr__(name: str):
+    # Lazy re-export so importing the package doesn't build the AI service
+    if name == 'ollama_service':
+        return get_ollama_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
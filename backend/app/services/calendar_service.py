@@ -1,14 +1,26 @@
 """
 Google Calendar integration service.
 """
-import json
+import asyncio
+import atexit
+import functools
+import logging
 import os
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timezone
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import ciso8601
+import httplib2
+from cachetools import TTLCache
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -17,6 +29,23 @@ from pydantic import BaseModel
 from app.core.config import settings
 from app.schemas.task import Task
 
+logger = logging.getLogger(__name__)
+
+# Bounded pool for the blocking Google API calls so a burst of slow
+# calendar requests cannot monopolize the loop's shared default executor
+_SYNC_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CALENDAR_SYNC_WORKERS", "16")),
+    thread_name_prefix="calendar-sync",
+)
+atexit.register(_SYNC_EXECUTOR.shutdown, wait=False)
+
+
+def _to_executor(func, *args):
+    """Schedule a blocking callable on the bounded calendar executor."""
+    return asyncio.get_running_loop().run_in_executor(
+        _SYNC_EXECUTOR, functools.partial(func, *args)
+    )
+
 
 class CalendarCredentials(BaseModel):
     """Model for storing calendar credentials."""
@@ -44,16 +73,94 @@ class GoogleCalendarService:
     
     SCOPES = ['https://www.googleapis.com/auth/calendar']
     CREDENTIALS_DIR = Path("credentials")
-    
+    STATUS_CACHE_TTL = 30  # seconds
+    MAX_BATCH_SIZE = 50  # Google Calendar caps batch requests at 50 operations
+    CREDS_EXPIRY_BUFFER = 300  # refresh cached credentials 5 min before expiry
+    NO_CREDS_TTL = 60  # negative-cache window for users with no stored credentials
+    CACHE_MAX_USERS = 10_000  # per-user cache ceiling so memory stays bounded
+    CACHE_TTL = 3300  # 55 min, just under Google's one-hour token lifetime
+
     def __init__(self):
         """Initialize the Google Calendar service."""
-        self.credentials: Optional[Credentials] = None
-        self.service = None
+        # All per-user caches are TTL + size bounded so a long tail of
+        # user_ids can't grow the resident set without limit
+        # (result, checked_at) caches for auth/connection probes
+        self._auth_status_cache: TTLCache = TTLCache(self.CACHE_MAX_USERS, self.STATUS_CACHE_TTL)
+        self._connection_cache: TTLCache = TTLCache(self.CACHE_MAX_USERS, self.STATUS_CACHE_TTL)
+        # TTLCache is not thread-safe and the sync executor runs many
+        # workers, so every status/primary cache access goes through this lock
+        self._cache_lock = threading.Lock()
+        # (credentials, stored_at) cache so hot paths skip the credential
+        # store lookup on every call
+        self._creds_cache: TTLCache = TTLCache(self.CACHE_MAX_USERS, self.CACHE_TTL)
+        # Negative cache: user_id -> recorded_at for known credential misses,
+        # so unauthenticated traffic skips the store lookup entirely
+        self._no_creds: TTLCache = TTLCache(self.CACHE_MAX_USERS, self.NO_CREDS_TTL)
+        self._creds_lock = threading.Lock()
+        # Single sqlite-backed credential store shared by all users; the
+        # connection stays open so loads are one indexed SELECT
+        self._creds_conn: Optional[sqlite3.Connection] = None
+        self._creds_db_path: Optional[Path] = None
+        # Per-thread, per-user built discovery Resource: httplib2 transports
+        # are not thread-safe, so each executor thread keeps its own
+        self._service_tls = threading.local()
+        # The primary calendar ID is effectively immutable per user
+        self._primary_cal_cache: TTLCache = TTLCache(self.CACHE_MAX_USERS, self.CACHE_TTL)
         self._ensure_credentials_dir()
+
+    def _get_cached_status(self, cache: Dict[str, Tuple[bool, float]], user_id: str) -> Optional[bool]:
+        """Return a cached probe result for user if it is still fresh."""
+        with self._cache_lock:
+            cached = cache.get(user_id)
+        if cached is not None and (time.time() - cached[1]) < self.STATUS_CACHE_TTL:
+            return cached[0]
+        return None
+
+    def _invalidate_status_caches(self, user_id: str) -> None:
+        """Drop cached probe results after a credential change for user."""
+        with self._cache_lock:
+            self._auth_status_cache.pop(user_id, None)
+            self._connection_cache.pop(user_id, None)
     
     def _ensure_credentials_dir(self) -> None:
         """Ensure credentials directory exists."""
         self.CREDENTIALS_DIR.mkdir(exist_ok=True)
+
+    @functools.cached_property
+    def _client_config(self) -> Dict[str, Any]:
+        """OAuth client config for Flow, built once per service instance."""
+        return {
+            "web": {
+                "client_id": settings.GOOGLE_CLIENT_ID,
+                "client_secret": settings.GOOGLE_CLIENT_SECRET,
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token",
+                "redirect_uris": [settings.GOOGLE_REDIRECT_URI]
+            }
+        }
+
+    def _make_flow(self) -> Flow:
+        """Build an OAuth flow from the cached client config."""
+        flow = Flow.from_client_config(self._client_config, scopes=self.SCOPES)
+        flow.redirect_uri = settings.GOOGLE_REDIRECT_URI
+        return flow
+
+    def _creds_db(self) -> sqlite3.Connection:
+        """Get the shared credential store connection, opening it on demand."""
+        db_path = self.CREDENTIALS_DIR / "calendar_creds.sqlite"
+        if self._creds_conn is None or self._creds_db_path != db_path:
+            self._ensure_credentials_dir()
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS calendar_credentials ("
+                "user_id TEXT PRIMARY KEY, creds_json TEXT NOT NULL, expiry REAL)"
+            )
+            conn.commit()
+            self._creds_conn = conn
+            self._creds_db_path = db_path
+        return self._creds_conn
     
     def get_auth_url(self, user_id: str) -> str:
         """
@@ -67,21 +174,9 @@ class GoogleCalendarService:
         """
         if not settings.GOOGLE_CLIENT_ID or not settings.GOOGLE_CLIENT_SECRET:
             raise ValueError("Google Calendar credentials not configured")
-        
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": settings.GOOGLE_CLIENT_ID,
-                    "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [settings.GOOGLE_REDIRECT_URI]
-                }
-            },
-            scopes=self.SCOPES
-        )
-        flow.redirect_uri = settings.GOOGLE_REDIRECT_URI
-        
+
+        flow = self._make_flow()
+
         # Store user_id in state for callback
         auth_url, state = flow.authorization_url(
             access_type='offline',
@@ -105,21 +200,9 @@ class GoogleCalendarService:
         try:
             if not settings.GOOGLE_CLIENT_ID or not settings.GOOGLE_CLIENT_SECRET:
                 raise ValueError("Google Calendar credentials not configured")
-            
-            flow = Flow.from_client_config(
-                {
-                    "web": {
-                        "client_id": settings.GOOGLE_CLIENT_ID,
-                        "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token",
-                        "redirect_uris": [settings.GOOGLE_REDIRECT_URI]
-                    }
-                },
-                scopes=self.SCOPES
-            )
-            flow.redirect_uri = settings.GOOGLE_REDIRECT_URI
-            
+
+            flow = self._make_flow()
+
             # Exchange code for credentials
             flow.fetch_token(code=code)
             credentials = flow.credentials
@@ -131,7 +214,7 @@ class GoogleCalendarService:
             return True
             
         except Exception as e:
-            print(f"OAuth callback error: {e}")
+            logger.warning("OAuth callback error: %s", e)
             return False
     
     def _store_credentials(self, user_id: str, credentials: Credentials) -> None:
@@ -150,13 +233,24 @@ class GoogleCalendarService:
             'client_secret': credentials.client_secret,
             'scopes': credentials.scopes
         }
-        
+
+        expiry_ts = None
         if credentials.expiry:
             creds_data['expiry'] = credentials.expiry.isoformat()
-        
-        creds_file = self.CREDENTIALS_DIR / f"{user_id}_calendar_creds.json"
-        with open(creds_file, 'w') as f:
-            json.dump(creds_data, f)
+            expiry_ts = credentials.expiry.timestamp()
+
+        conn = self._creds_db()
+        conn.execute(
+            "INSERT OR REPLACE INTO calendar_credentials (user_id, creds_json, expiry) "
+            "VALUES (?, ?, ?)",
+            (user_id, orjson.dumps(creds_data).decode(), expiry_ts)
+        )
+        conn.commit()
+
+        with self._creds_lock:
+            self._creds_cache[user_id] = (credentials, time.time())
+            self._no_creds.pop(user_id, None)
+        self._invalidate_status_caches(user_id)
     
     def _load_credentials(self, user_id: str) -> Optional[Credentials]:
         """
@@ -168,15 +262,39 @@ class GoogleCalendarService:
         Returns:
             Credentials if found and valid, None otherwise
         """
-        creds_file = self.CREDENTIALS_DIR / f"{user_id}_calendar_creds.json"
-        
-        if not creds_file.exists():
-            return None
-        
+        with self._creds_lock:
+            cached = self._creds_cache.get(user_id)
+
+        # Fast path: cached credentials comfortably away from expiry need no
+        # store lookup at all
+        if cached is not None:
+            credentials, _ = cached
+            expiry = credentials.expiry
+            if expiry is None or (expiry - datetime.utcnow()).total_seconds() > self.CREDS_EXPIRY_BUFFER:
+                return credentials
+
+        # Negative cache: a recent miss means no stored credentials, so
+        # unauthenticated users don't hit the store on every request
+        with self._creds_lock:
+            recorded_at = self._no_creds.get(user_id)
+            if recorded_at is not None:
+                if (time.time() - recorded_at) < self.NO_CREDS_TTL:
+                    return None
+                self._no_creds.pop(user_id, None)
+
         try:
-            with open(creds_file, 'r') as f:
-                creds_data = json.load(f)
-            
+            row = self._creds_db().execute(
+                "SELECT creds_json FROM calendar_credentials WHERE user_id = ?",
+                (user_id,)
+            ).fetchone()
+
+            if row is None:
+                with self._creds_lock:
+                    self._no_creds[user_id] = time.time()
+                return None
+
+            creds_data = orjson.loads(row[0])
+
             credentials = Credentials(
                 token=creds_data['token'],
                 refresh_token=creds_data.get('refresh_token'),
@@ -185,43 +303,90 @@ class GoogleCalendarService:
                 client_secret=creds_data['client_secret'],
                 scopes=creds_data['scopes']
             )
-            
+
             if 'expiry' in creds_data:
-                credentials.expiry = datetime.fromisoformat(creds_data['expiry'])
-            
-            # Refresh token if expired
-            if credentials.expired and credentials.refresh_token:
+                credentials.expiry = ciso8601.parse_datetime(creds_data['expiry'])
+
+            # Refresh proactively when close to expiry, so callers never pay
+            # a failed API call plus refresh plus retry
+            near_expiry = (
+                credentials.expiry is not None
+                and (credentials.expiry - datetime.utcnow()) < timedelta(seconds=self.CREDS_EXPIRY_BUFFER)
+            )
+            if (credentials.expired or near_expiry) and credentials.refresh_token:
                 credentials.refresh(Request())
                 self._store_credentials(user_id, credentials)
-            
+            else:
+                with self._creds_lock:
+                    self._creds_cache[user_id] = (credentials, time.time())
+
             return credentials
-            
+
         except Exception as e:
-            print(f"Error loading credentials: {e}")
+            logger.warning("Error loading credentials: %s", e)
             return None
     
+    def _get_service(self, user_id: str) -> Optional[Any]:
+        """
+        Get an authorized Calendar API service for user.
+
+        State lives only in the per-user caches, never on the instance, so
+        concurrent requests for different users can't clobber each other.
+        The built Resource and its httplib2 transport are cached per thread
+        because httplib2 is not thread-safe; stale entries age out via TTL
+        or fail the credentials identity check after a credential change.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Calendar API Resource if the user is authenticated, None otherwise
+        """
+        try:
+            credentials = self._load_credentials(user_id)
+
+            if not credentials or not credentials.valid:
+                return None
+
+            # Reuse the built Resource while the credentials object is
+            # unchanged; build() re-parses the discovery document otherwise
+            cache = getattr(self._service_tls, "services", None)
+            if cache is None:
+                cache = self._service_tls.services = TTLCache(
+                    self.CACHE_MAX_USERS, self.CACHE_TTL
+                )
+            cached = cache.get(user_id)
+            if cached is not None and cached[1] is credentials:
+                return cached[0]
+
+            # One authorized keep-alive transport per thread and user;
+            # reusing it with the cached Resource avoids a TCP+TLS
+            # handshake per API call
+            authorized_http = AuthorizedHttp(credentials, http=httplib2.Http())
+            service = build(
+                'calendar', 'v3',
+                http=authorized_http,
+                cache_discovery=False,
+                static_discovery=True,
+            )
+            cache[user_id] = (service, credentials)
+            return service
+
+        except Exception as e:
+            logger.warning("Error initializing calendar service: %s", e)
+            return None
+
     def initialize_service(self, user_id: str) -> bool:
         """
         Initialize Google Calendar service for user.
-        
+
         Args:
             user_id: User identifier
-            
+
         Returns:
             True if service initialized successfully, False otherwise
         """
-        try:
-            self.credentials = self._load_credentials(user_id)
-            
-            if not self.credentials or not self.credentials.valid:
-                return False
-            
-            self.service = build('calendar', 'v3', credentials=self.credentials)
-            return True
-            
-        except Exception as e:
-            print(f"Error initializing calendar service: {e}")
-            return False
+        return self._get_service(user_id) is not None
     
     def test_connection(self, user_id: str) -> bool:
         """
@@ -233,48 +398,63 @@ class GoogleCalendarService:
         Returns:
             True if connection successful, False otherwise
         """
+        cached = self._get_cached_status(self._connection_cache, user_id)
+        if cached is not None:
+            return cached
+
         try:
-            if not self.initialize_service(user_id):
-                return False
-            
-            # Try to list calendars as a connection test
-            calendars_result = self.service.calendarList().list().execute()
-            calendars = calendars_result.get('items', [])
-            
-            return len(calendars) > 0
-            
+            service = self._get_service(user_id)
+            if service is None:
+                connection_ok = False
+            else:
+                # Try to list calendars as a connection test
+                calendars_result = service.calendarList().list().execute()
+                calendars = calendars_result.get('items', [])
+
+                connection_ok = len(calendars) > 0
+
         except HttpError as e:
-            print(f"Calendar API error: {e}")
-            return False
+            logger.warning("Calendar API error: %s", e)
+            connection_ok = False
         except Exception as e:
-            print(f"Connection test error: {e}")
-            return False
+            logger.warning("Connection test error: %s", e)
+            connection_ok = False
+
+        with self._cache_lock:
+            self._connection_cache[user_id] = (connection_ok, time.time())
+        return connection_ok
     
-    def get_primary_calendar_id(self, user_id: str) -> Optional[str]:
+    def get_primary_calendar_id(self, user_id: str, service: Optional[Any] = None) -> Optional[str]:
         """
         Get the primary calendar ID for the user.
-        
+
         Args:
             user_id: User identifier
-            
+            service: Already-initialized Calendar API service to reuse;
+                looked up from the cache when omitted
+
         Returns:
             Primary calendar ID if found, None otherwise
         """
+        with self._cache_lock:
+            cached = self._primary_cal_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         try:
-            if not self.initialize_service(user_id):
-                return None
-            
-            calendars_result = self.service.calendarList().list().execute()
-            calendars = calendars_result.get('items', [])
-            
-            for calendar in calendars:
-                if calendar.get('primary', False):
-                    return calendar['id']
-            
-            return None
-            
+            if service is None:
+                service = self._get_service(user_id)
+                if service is None:
+                    return None
+
+            # One targeted GET instead of listing every subscribed calendar
+            calendar_id = service.calendars().get(calendarId='primary').execute()['id']
+            with self._cache_lock:
+                self._primary_cal_cache[user_id] = calendar_id
+            return calendar_id
+
         except Exception as e:
-            print(f"Error getting primary calendar: {e}")
+            logger.warning("Error getting primary calendar: %s", e)
             return None
     
     def is_authenticated(self, user_id: str) -> bool:
@@ -287,8 +467,15 @@ class GoogleCalendarService:
         Returns:
             True if authenticated, False otherwise
         """
+        cached = self._get_cached_status(self._auth_status_cache, user_id)
+        if cached is not None:
+            return cached
+
         credentials = self._load_credentials(user_id)
-        return credentials is not None and credentials.valid
+        authenticated = credentials is not None and credentials.valid
+        with self._cache_lock:
+            self._auth_status_cache[user_id] = (authenticated, time.time())
+        return authenticated
     
     def revoke_access(self, user_id: str) -> bool:
         """
@@ -307,14 +494,29 @@ class GoogleCalendarService:
                 credentials.revoke(Request())
             
             # Remove stored credentials
+            conn = self._creds_db()
+            conn.execute(
+                "DELETE FROM calendar_credentials WHERE user_id = ?", (user_id,)
+            )
+            conn.commit()
+
+            # Clean up any credentials file left over from the old per-user
+            # JSON scheme
             creds_file = self.CREDENTIALS_DIR / f"{user_id}_calendar_creds.json"
             if creds_file.exists():
                 creds_file.unlink()
-            
+
+            with self._creds_lock:
+                self._creds_cache.pop(user_id, None)
+            # Thread-local service entries go stale here too: they fail the
+            # credentials identity check on next use and get rebuilt
+            with self._cache_lock:
+                self._primary_cal_cache.pop(user_id, None)
+            self._invalidate_status_caches(user_id)
             return True
             
         except Exception as e:
-            print(f"Error revoking access: {e}")
+            logger.warning("Error revoking access: %s", e)
             return False
     
     def create_calendar_event(self, user_id: str, task: Task) -> Optional[CalendarEvent]:
@@ -329,38 +531,23 @@ class GoogleCalendarService:
             Created calendar event if successful, None otherwise
         """
         try:
-            if not self.initialize_service(user_id):
+            service = self._get_service(user_id)
+            if service is None:
                 return None
-            
+
             if not task.due_date:
                 return None
-            
-            calendar_id = self.get_primary_calendar_id(user_id)
+
+            calendar_id = self.get_primary_calendar_id(user_id, service)
             if not calendar_id:
                 return None
             
-            # Create event data
-            event_data = {
-                'summary': task.title,
-                'description': f"{task.description or ''}\n\nTask ID: {task.id}",
-                'start': {
-                    'dateTime': task.due_date.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': (task.due_date.replace(hour=task.due_date.hour + 1)).isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'extendedProperties': {
-                    'private': {
-                        'task_id': str(task.id),
-                        'app_source': 'ollama_todo'
-                    }
-                }
-            }
-            
+            # Share the body builder with the batch-sync path instead of
+            # rebuilding the nested literal inline
+            event_data = self._build_event_body(task)
+
             # Create the event
-            created_event = self.service.events().insert(
+            created_event = service.events().insert(
                 calendarId=calendar_id,
                 body=event_data
             ).execute()
@@ -369,16 +556,16 @@ class GoogleCalendarService:
                 id=created_event['id'],
                 summary=created_event['summary'],
                 description=created_event.get('description', ''),
-                start=datetime.fromisoformat(created_event['start']['dateTime'].replace('Z', '+00:00')),
-                end=datetime.fromisoformat(created_event['end']['dateTime'].replace('Z', '+00:00')),
+                start=ciso8601.parse_datetime(created_event['start']['dateTime']),
+                end=ciso8601.parse_datetime(created_event['end']['dateTime']),
                 task_id=task.id
             )
             
         except HttpError as e:
-            print(f"Calendar API error creating event: {e}")
+            logger.warning("Calendar API error creating event: %s", e)
             return None
         except Exception as e:
-            print(f"Error creating calendar event: {e}")
+            logger.warning("Error creating calendar event: %s", e)
             return None
     
     def update_calendar_event(self, user_id: str, task: Task, event_id: str) -> bool:
@@ -394,47 +581,43 @@ class GoogleCalendarService:
             True if updated successfully, False otherwise
         """
         try:
-            if not self.initialize_service(user_id):
+            service = self._get_service(user_id)
+            if service is None:
                 return False
             
-            calendar_id = self.get_primary_calendar_id(user_id)
+            calendar_id = self.get_primary_calendar_id(user_id, service)
             if not calendar_id:
                 return False
             
-            # Get existing event
-            existing_event = self.service.events().get(
-                calendarId=calendar_id,
-                eventId=event_id
-            ).execute()
-            
-            # Update event data
+            # Send only the changed fields in a single PATCH round-trip
+            # instead of the old GET-then-UPDATE pair
+            patch_body: Dict[str, Any] = {
+                'summary': task.title,
+                'description': ''.join((task.description or '', '\n\nTask ID: ', str(task.id))),
+            }
             if task.due_date:
-                existing_event['start'] = {
+                patch_body['start'] = {
                     'dateTime': task.due_date.isoformat(),
                     'timeZone': 'UTC',
                 }
-                existing_event['end'] = {
-                    'dateTime': (task.due_date.replace(hour=task.due_date.hour + 1)).isoformat(),
+                patch_body['end'] = {
+                    'dateTime': (task.due_date + timedelta(hours=1)).isoformat(),
                     'timeZone': 'UTC',
                 }
-            
-            existing_event['summary'] = task.title
-            existing_event['description'] = f"{task.description or ''}\n\nTask ID: {task.id}"
-            
-            # Update the event
-            self.service.events().update(
+
+            service.events().patch(
                 calendarId=calendar_id,
                 eventId=event_id,
-                body=existing_event
+                body=patch_body
             ).execute()
-            
+
             return True
             
         except HttpError as e:
-            print(f"Calendar API error updating event: {e}")
+            logger.warning("Calendar API error updating event: %s", e)
             return False
         except Exception as e:
-            print(f"Error updating calendar event: {e}")
+            logger.warning("Error updating calendar event: %s", e)
             return False
     
     def delete_calendar_event(self, user_id: str, event_id: str) -> bool:
@@ -449,15 +632,16 @@ class GoogleCalendarService:
             True if deleted successfully, False otherwise
         """
         try:
-            if not self.initialize_service(user_id):
+            service = self._get_service(user_id)
+            if service is None:
                 return False
             
-            calendar_id = self.get_primary_calendar_id(user_id)
+            calendar_id = self.get_primary_calendar_id(user_id, service)
             if not calendar_id:
                 return False
             
             # Delete the event
-            self.service.events().delete(
+            service.events().delete(
                 calendarId=calendar_id,
                 eventId=event_id
             ).execute()
@@ -468,10 +652,10 @@ class GoogleCalendarService:
             if e.resp.status == 404:
                 # Event already deleted or doesn't exist
                 return True
-            print(f"Calendar API error deleting event: {e}")
+            logger.warning("Calendar API error deleting event: %s", e)
             return False
         except Exception as e:
-            print(f"Error deleting calendar event: {e}")
+            logger.warning("Error deleting calendar event: %s", e)
             return False
     
     def sync_task_to_calendar(self, user_id: str, task: Task) -> Optional[str]:
@@ -492,16 +676,167 @@ class GoogleCalendarService:
             # If task already has a calendar event, update it
             if task.calendar_event_id:
                 success = self.update_calendar_event(user_id, task, task.calendar_event_id)
-                return task.calendar_event_id if success else None
-            
+                if success:
+                    return task.calendar_event_id
+                # Stale event ID (e.g. event deleted directly in Calendar):
+                # fall through and recreate instead of giving up
+
             # Otherwise, create a new event
             calendar_event = self.create_calendar_event(user_id, task)
             return calendar_event.id if calendar_event else None
             
         except Exception as e:
-            print(f"Error syncing task to calendar: {e}")
+            logger.warning("Error syncing task to calendar: %s", e)
             return None
     
+    def _build_event_body(self, task: Task) -> Dict[str, Any]:
+        """Build the calendar event body for a task."""
+        task_id = str(task.id)
+        return {
+            'summary': task.title,
+            # join avoids the f-string format machinery on the bulk path
+            'description': ''.join((task.description or '', '\n\nTask ID: ', task_id)),
+            'start': {
+                'dateTime': task.due_date.isoformat(),
+                'timeZone': 'UTC',
+            },
+            'end': {
+                'dateTime': (task.due_date + timedelta(hours=1)).isoformat(),
+                'timeZone': 'UTC',
+            },
+            'extendedProperties': {
+                'private': {
+                    'task_id': task_id,
+                    'app_source': 'ollama_todo'
+                }
+            }
+        }
+
+    def sync_tasks_to_calendar(self, user_id: str, tasks: List[Task]) -> Dict[int, Optional[str]]:
+        """
+        Sync multiple tasks to Google Calendar in one batch HTTP request.
+
+        Args:
+            user_id: User identifier
+            tasks: Tasks to sync
+
+        Returns:
+            Mapping of task ID to calendar event ID (None where sync failed)
+        """
+        results: Dict[int, Optional[str]] = {task.id: None for task in tasks}
+
+        syncable = [task for task in tasks if task.due_date]
+        if not syncable:
+            return results
+
+        try:
+            service = self._get_service(user_id)
+            if service is None:
+                return results
+
+            calendar_id = self.get_primary_calendar_id(user_id, service)
+            if not calendar_id:
+                return results
+
+            def _make_callback(task_id: int):
+                def _callback(request_id, response, exception):
+                    if exception is not None:
+                        logger.warning("Batch sync error for task %s: %s", task_id, exception)
+                    else:
+                        results[task_id] = response['id']
+                return _callback
+
+            # One batch.execute() per chunk of 50 — the API's batch ceiling
+            for start in range(0, len(syncable), self.MAX_BATCH_SIZE):
+                batch = service.new_batch_http_request()
+                for task in syncable[start:start + self.MAX_BATCH_SIZE]:
+                    event_body = self._build_event_body(task)
+                    if task.calendar_event_id:
+                        request = service.events().patch(
+                            calendarId=calendar_id,
+                            eventId=task.calendar_event_id,
+                            body=event_body
+                        )
+                    else:
+                        request = service.events().insert(
+                            calendarId=calendar_id,
+                            body=event_body
+                        )
+                    batch.add(request, callback=_make_callback(task.id))
+                batch.execute()
+
+            return results
+
+        except HttpError as e:
+            logger.warning("Calendar API error batch syncing tasks: %s", e)
+            return results
+        except Exception as e:
+            logger.warning("Error batch syncing tasks to calendar: %s", e)
+            return results
+
+    def get_calendar_events_for_tasks(self, user_id: str, task_ids: List[int]) -> Dict[int, List[CalendarEvent]]:
+        """
+        Get calendar events for multiple tasks in one batch HTTP request.
+
+        Args:
+            user_id: User identifier
+            task_ids: Task IDs to search for
+
+        Returns:
+            Mapping of task ID to its calendar events
+        """
+        results: Dict[int, List[CalendarEvent]] = {task_id: [] for task_id in task_ids}
+
+        if not task_ids:
+            return results
+
+        try:
+            service = self._get_service(user_id)
+            if service is None:
+                return results
+
+            calendar_id = self.get_primary_calendar_id(user_id, service)
+            if not calendar_id:
+                return results
+
+            def _make_callback(task_id: int):
+                def _callback(request_id, response, exception):
+                    if exception is not None:
+                        logger.warning("Batch event lookup error for task %s: %s", task_id, exception)
+                        return
+                    for event in response.get('items', []):
+                        try:
+                            results[task_id].append(CalendarEvent(
+                                id=event['id'],
+                                summary=event.get('summary', ''),
+                                description=event.get('description', ''),
+                                start=ciso8601.parse_datetime(event['start']['dateTime']),
+                                end=ciso8601.parse_datetime(event['end']['dateTime']),
+                                task_id=task_id
+                            ))
+                        except Exception as e:
+                            logger.warning("Error parsing calendar event: %s", e)
+                return _callback
+
+            for start in range(0, len(task_ids), self.MAX_BATCH_SIZE):
+                batch = service.new_batch_http_request()
+                for task_id in task_ids[start:start + self.MAX_BATCH_SIZE]:
+                    request = service.events().list(
+                        calendarId=calendar_id,
+                        privateExtendedProperty=f'task_id={task_id}'
+                    )
+                    batch.add(request, callback=_make_callback(task_id))
+                batch.execute()
+
+            return results
+
+        except HttpError as e:
+            logger.warning("Calendar API error batch getting events: %s", e)
+            return results
+        except Exception as e:
+            logger.warning("Error batch getting calendar events: %s", e)
+            return results
+
     def remove_task_from_calendar(self, user_id: str, task: Task) -> bool:
         """
         Remove a task from Google Calendar.
@@ -520,58 +855,103 @@ class GoogleCalendarService:
             return self.delete_calendar_event(user_id, task.calendar_event_id)
             
         except Exception as e:
-            print(f"Error removing task from calendar: {e}")
+            logger.warning("Error removing task from calendar: %s", e)
             return False
     
-    def get_calendar_events_for_task(self, user_id: str, task_id: int) -> List[CalendarEvent]:
+    def get_calendar_events_for_task(
+        self,
+        user_id: str,
+        task_id: int,
+        calendar_event_id: Optional[str] = None
+    ) -> List[CalendarEvent]:
         """
         Get calendar events associated with a specific task.
-        
+
         Args:
             user_id: User identifier
             task_id: Task ID to search for
-            
+            calendar_event_id: Known event ID for the task; enables a direct
+                O(1) fetch instead of a filtered calendar scan
+
         Returns:
             List of calendar events for the task
         """
         try:
-            if not self.initialize_service(user_id):
+            service = self._get_service(user_id)
+            if service is None:
                 return []
-            
-            calendar_id = self.get_primary_calendar_id(user_id)
+
+            calendar_id = self.get_primary_calendar_id(user_id, service)
             if not calendar_id:
                 return []
-            
-            # Search for events with the task ID in extended properties
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                privateExtendedProperty=f'task_id={task_id}'
-            ).execute()
-            
+
+            if calendar_event_id:
+                # The task already knows its event: one targeted GET instead
+                # of listing and filtering the whole calendar
+                event = service.events().get(
+                    calendarId=calendar_id,
+                    eventId=calendar_event_id
+                ).execute()
+                items = [event]
+            else:
+                # Legacy tasks without a stored event ID: fall back to the
+                # extended-property search
+                items = service.events().list(
+                    calendarId=calendar_id,
+                    privateExtendedProperty=f'task_id={task_id}'
+                ).execute().get('items', [])
+
             events = []
-            for event in events_result.get('items', []):
+            for event in items:
                 try:
                     events.append(CalendarEvent(
                         id=event['id'],
                         summary=event.get('summary', ''),
                         description=event.get('description', ''),
-                        start=datetime.fromisoformat(event['start']['dateTime'].replace('Z', '+00:00')),
-                        end=datetime.fromisoformat(event['end']['dateTime'].replace('Z', '+00:00')),
+                        start=ciso8601.parse_datetime(event['start']['dateTime']),
+                        end=ciso8601.parse_datetime(event['end']['dateTime']),
                         task_id=task_id
                     ))
                 except Exception as e:
-                    print(f"Error parsing calendar event: {e}")
+                    logger.warning("Error parsing calendar event: %s", e)
                     continue
             
             return events
             
         except HttpError as e:
-            print(f"Calendar API error getting events: {e}")
+            logger.warning("Calendar API error getting events: %s", e)
             return []
         except Exception as e:
-            print(f"Error getting calendar events: {e}")
+            logger.warning("Error getting calendar events: %s", e)
             return []
     
+    async def async_create_calendar_event(self, user_id: str, task: Task) -> Optional[CalendarEvent]:
+        """Async wrapper for create_calendar_event; runs the HTTP I/O off-loop."""
+        return await _to_executor(self.create_calendar_event, user_id, task)
+
+    async def async_sync_task_to_calendar(self, user_id: str, task: Task) -> Optional[str]:
+        """Async wrapper for sync_task_to_calendar; runs the HTTP I/O off-loop."""
+        return await _to_executor(self.sync_task_to_calendar, user_id, task)
+
+    async def async_sync_tasks_to_calendar(self, user_id: str, tasks: List[Task]) -> Dict[int, Optional[str]]:
+        """Async wrapper for sync_tasks_to_calendar; runs the HTTP I/O off-loop."""
+        return await _to_executor(self.sync_tasks_to_calendar, user_id, tasks)
+
+    async def async_remove_task_from_calendar(self, user_id: str, task: Task) -> bool:
+        """Async wrapper for remove_task_from_calendar; runs the HTTP I/O off-loop."""
+        return await _to_executor(self.remove_task_from_calendar, user_id, task)
+
+    async def async_get_calendar_events_for_task(
+        self,
+        user_id: str,
+        task_id: int,
+        calendar_event_id: Optional[str] = None
+    ) -> List[CalendarEvent]:
+        """Async wrapper for get_calendar_events_for_task; runs the HTTP I/O off-loop."""
+        return await _to_executor(
+            self.get_calendar_events_for_task, user_id, task_id, calendar_event_id
+        )
+
     def handle_calendar_api_error(self, error: Exception) -> Dict[str, Any]:
         """
         Handle calendar API errors and provide user-friendly messages.
@@ -624,4 +1004,9 @@ class GoogleCalendarService:
 
 
 # Global calendar service instance
-calendar_service = GoogleCalendarService()
\ No newline at end of file
+calendar_service = GoogleCalendarService()
+
+
+def get_calendar_service() -> GoogleCalendarService:
+    """FastAPI dependency provider for the shared calendar service."""
+    return calendar_service
\ No newline at end of file
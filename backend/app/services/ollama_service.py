@@ -1,50 +1,270 @@
 """
 Ollama service for AI-powered task management features.
 """
-import json
 import logging
-from typing import List, Optional, Dict, Any
+import sys
+from collections import Counter
+from functools import cache, lru_cache
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import asyncio
 import time
 
+import httpx
+import msgspec
 import ollama
-from pydantic import BaseModel, ValidationError
+import orjson
+from cachetools import TTLCache
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from ..schemas.task import GeneratedTask, TaskCategory, Priority, WorkloadAnalysis
 
 
+# Compiled once at import so list validation runs as a single
+# pydantic-core pass instead of per-instance Python-level construction
+_TASKS_ADAPTER = TypeAdapter(List[GeneratedTask])
+
+
 logger = logging.getLogger(__name__)
 
+# fromisoformat accepts the Z suffix natively from 3.11 onwards
+_Z_NEEDS_REPLACE = sys.version_info < (3, 11)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, memoized since due dates repeat often."""
+    if _Z_NEEDS_REPLACE and value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def _compile_prompt(template: str, *fields: str):
+    """
+    Pre-split a prompt template into static segments around its placeholders.
+
+    str.format re-parses the template string on every call; these prompts
+    are fixed class attributes, so splitting them once lets each render be
+    a plain join of precomputed segments and the dynamic values.
+    """
+    segments = []
+    rest = template
+    for field in fields:
+        head, rest = rest.split('{' + field + '}')
+        segments.append(head)
+    segments.append(rest)
+
+    def render(*values: str) -> str:
+        parts = []
+        for segment, value in zip(segments, values):
+            parts.append(segment)
+            parts.append(value)
+        parts.append(segments[-1])
+        return ''.join(parts)
+
+    return render
+
+
+class _TaskRow(msgspec.Struct, gc=False):
+    """Slot-based view of a task dict for the workload stats loop."""
+    status: str = 'PENDING'
+    priority: str = 'MEDIUM'
+    due_date: Optional[str] = None
+
 
 class OllamaConnectionError(Exception):
     """Raised when Ollama connection fails."""
     pass
 
 
+class _JsonArrayParser:
+    """
+    Incrementally extracts complete top-level objects from a streamed JSON array.
+
+    Fed token-sized chunks, it tracks brace depth and string state and
+    returns each object's text as soon as its closing brace arrives, so a
+    consumer can act on the first item while the model is still generating
+    the rest.
+    """
+
+    def __init__(self):
+        self._buf: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> List[str]:
+        """Consume a chunk and return any newly completed object strings."""
+        complete = []
+        for char in text:
+            if self._depth == 0:
+                if char == '{':
+                    self._depth = 1
+                    self._buf = [char]
+                continue
+            self._buf.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == '{':
+                self._depth += 1
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    complete.append(''.join(self._buf))
+                    self._buf = []
+        return complete
+
+
+class _BatchQueue:
+    """
+    Coalesces concurrent requests into batched model calls.
+
+    Items submitted within a small time window (or until the batch fills up)
+    are sent to Ollama as one multi-item prompt, cutting N concurrent
+    round-trips down to one.
+    """
+
+    def __init__(self, run_batch, max_batch_size: int = 16, flush_interval: float = 0.05):
+        """
+        Initialize the batch queue.
+
+        Args:
+            run_batch: Async callable taking a list of items and returning a
+                list of results in the same order
+            max_batch_size: Flush immediately once this many items are queued
+            flush_interval: Maximum seconds an item waits before its batch flushes
+        """
+        self._run_batch = run_batch
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._pending: List[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Enqueue an item and wait for its batched result.
+
+        Args:
+            item: Item to include in the next batch
+
+        Returns:
+            The result corresponding to this item
+        """
+        future = asyncio.get_running_loop().create_future()
+        batch = None
+        async with self._lock:
+            self._pending.append((item, future))
+            if len(self._pending) >= self._max_batch_size:
+                batch = self._drain()
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_after_interval())
+        if batch:
+            await self._dispatch(batch)
+        return await future
+
+    def _drain(self) -> List[tuple]:
+        """Take ownership of all pending items. Caller must hold the lock."""
+        batch, self._pending = self._pending, []
+        return batch
+
+    async def _flush_after_interval(self) -> None:
+        """Flush whatever accumulated once the batching window elapses."""
+        await asyncio.sleep(self._flush_interval)
+        async with self._lock:
+            batch = self._drain()
+        if batch:
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[tuple]) -> None:
+        """Run one batch and resolve each waiter with its own result."""
+        try:
+            results = await self._run_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(OllamaConnectionError(f"Batched request failed: {e}"))
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
 class OllamaService:
     """Service for interacting with local Ollama instance."""
     
-    def __init__(self, host: str = "http://localhost:11434", model: str = "llama2"):
+    def __init__(self, host: str = "http://localhost:11434", model: str = "llama2",
+                 hosts: Optional[List[str]] = None,
+                 client_kwargs: Optional[Dict[str, Any]] = None):
         """
         Initialize Ollama service.
         
         Args:
             host: Ollama server host URL
             model: Default model to use for completions
+            hosts: Optional list of backend host URLs; when given, each
+                generation goes to the least-loaded healthy host
+            client_kwargs: Optional extra keyword arguments forwarded to the
+                underlying httpx client (connection limits, timeouts, ...)
         """
-        self.host = host
+        self.hosts = list(hosts) if hosts else [host]
+        self.host = self.hosts[0]
         self.model = model
         self.client = None
+        self._client_kwargs = dict(client_kwargs) if client_kwargs else {}
+        # Per-host client pool, in-flight counters, and failure marks used
+        # by the least-connections host selection
+        self._clients: Dict[str, ollama.AsyncClient] = {}
+        self._inflight: Dict[str, int] = {h: 0 for h in self.hosts}
+        self._unhealthy_hosts: set = set()
         self._connection_healthy = False
         self._last_health_check = 0
         self._health_check_interval = 30  # seconds
+        # Circuit breaker: after repeated failures, fail fast for a cooldown
+        # period instead of probing Ollama on every request
+        self._consecutive_failures = 0
+        self._failure_threshold = 3
+        self._circuit_open_until = 0
+        self._circuit_cooldown = 60  # seconds
+        self._refresh_interval = 3.0  # seconds between background health probes
+        self._refresher_task: Optional[asyncio.Task] = None
+        # Single-flight guard so concurrent cache misses coalesce into one probe
+        self._health_lock = asyncio.Lock()
+        # Bumped on model changes so result caches keyed on it invalidate
+        self._cache_gen = 0
         
-    def _get_client(self) -> ollama.Client:
-        """Get or create Ollama client."""
-        if self.client is None:
-            self.client = ollama.Client(host=self.host)
-        return self.client
+    def _get_async_client(self, host: Optional[str] = None) -> ollama.AsyncClient:
+        """Get or create the shared async client for a host (primary by default)."""
+        if host is None or host == self.host:
+            if self.client is None:
+                self.client = ollama.AsyncClient(host=self.host, **self._client_kwargs)
+                self._clients[self.host] = self.client
+            return self.client
+        client = self._clients.get(host)
+        if client is None:
+            client = self._clients[host] = ollama.AsyncClient(host=host, **self._client_kwargs)
+        return client
+
+    def _pick_host(self) -> str:
+        """
+        Choose the least-loaded host for the next generation.
+
+        Hosts marked unhealthy by recent call failures are skipped unless
+        every host is marked; secondary hosts recover as soon as a call to
+        them succeeds.
+        """
+        if len(self.hosts) == 1:
+            return self.hosts[0]
+        candidates = [h for h in self.hosts if h not in self._unhealthy_hosts] or self.hosts
+        return min(candidates, key=lambda h: self._inflight.get(h, 0))
     
     async def check_connection(self, force_check: bool = False) -> bool:
         """
@@ -56,16 +276,31 @@ class OllamaService:
         Returns:
             True if Ollama is available, False otherwise
         """
-        current_time = time.time()
-        
+        current_time = time.monotonic()
+
+        # Circuit open: fail fast without touching the network
+        if not force_check and current_time < self._circuit_open_until:
+            return False
+
         # Use cached result if recent enough and not forcing
         if not force_check and (current_time - self._last_health_check) < self._health_check_interval:
             return self._connection_healthy
-        
+
+        async with self._health_lock:
+            # Double-checked: another caller may have refreshed the cache
+            # while we waited for the lock
+            current_time = time.monotonic()
+            if not force_check and (current_time - self._last_health_check) < self._health_check_interval:
+                return self._connection_healthy
+
+            return await self._probe_connection(current_time)
+
+    async def _probe_connection(self, current_time: float) -> bool:
+        """Issue one health probe and update the cached state."""
         try:
-            client = self._get_client()
+            client = self._get_async_client()
             # Try to list models as a health check
-            models = client.list()
+            models = await client.list()
             
             # Check if our preferred model is available
             available_models = [model['name'] for model in models.get('models', [])]
@@ -84,7 +319,19 @@ class OllamaService:
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
             self._connection_healthy = False
-        
+
+        if self._connection_healthy:
+            self._consecutive_failures = 0
+            self._circuit_open_until = 0
+        else:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._failure_threshold:
+                self._circuit_open_until = current_time + self._circuit_cooldown
+                logger.warning(
+                    f"Ollama circuit opened for {self._circuit_cooldown}s "
+                    f"after {self._consecutive_failures} consecutive failures"
+                )
+
         self._last_health_check = current_time
         return self._connection_healthy
     
@@ -104,27 +351,56 @@ class OllamaService:
             OllamaConnectionError: If all retries fail
         """
         last_exception = None
-        
+
         for attempt in range(max_retries + 1):
+            # Circuit open: fail fast without touching the network
+            if time.monotonic() < self._circuit_open_until:
+                raise OllamaConnectionError("Ollama service unavailable (circuit open)")
+
             try:
-                # Check connection before attempting
-                if not await self.check_connection():
-                    raise OllamaConnectionError("Ollama service unavailable")
-                
-                return await func()
-                
+                # No separate pre-flight probe: the real call is the health
+                # signal, so the healthy path pays zero extra round-trips
+                result = await func()
+
+                self._connection_healthy = True
+                self._last_health_check = time.monotonic()
+                self._consecutive_failures = 0
+                self._circuit_open_until = 0
+                return result
+
             except Exception as e:
                 last_exception = e
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                
+
+                if self._is_connection_error(e):
+                    # Invalidate cached health so the next caller re-probes;
+                    # protocol-level errors leave health state alone
+                    self._connection_healthy = False
+                    self._last_health_check = 0
+                    self._consecutive_failures += 1
+                    if self._consecutive_failures >= self._failure_threshold:
+                        self._circuit_open_until = time.monotonic() + self._circuit_cooldown
+                        logger.warning(
+                            f"Ollama circuit opened for {self._circuit_cooldown}s "
+                            f"after {self._consecutive_failures} consecutive failures"
+                        )
+
                 if attempt < max_retries:
                     delay = base_delay * (2 ** attempt)
                     logger.info(f"Retrying in {delay} seconds...")
                     await asyncio.sleep(delay)
                 else:
                     break
-        
+
         raise OllamaConnectionError(f"All retry attempts failed. Last error: {last_exception}")
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        """Whether an error means Ollama is unreachable rather than a bad request."""
+        return isinstance(
+            error,
+            (OllamaConnectionError, ConnectionError, asyncio.TimeoutError, httpx.TransportError),
+        )
     
     async def _generate_completion(self, prompt: str, system_prompt: Optional[str] = None, timeout: float = 45.0) -> str:
         """
@@ -142,33 +418,73 @@ class OllamaService:
             OllamaConnectionError: If Ollama is unavailable
         """
         async def _do_generate():
-            client = self._get_client()
-            
+            host = self._pick_host()
+            client = self._get_async_client(host)
+
             messages = []
             if system_prompt:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
-            
-            # Run the synchronous ollama call in a thread with timeout
-            loop = asyncio.get_event_loop()
+
+            # The async client drives the HTTP stream on the event loop, so
+            # no worker thread is tied up for the whole generation
+            self._inflight[host] = self._inflight.get(host, 0) + 1
             try:
                 response = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None, 
-                        lambda: client.chat(
-                            model=self.model,
-                            messages=messages,
-                            stream=False
-                        )
+                    client.chat(
+                        model=self.model,
+                        messages=messages,
+                        stream=False
                     ),
                     timeout=timeout
                 )
+                self._unhealthy_hosts.discard(host)
                 return response['message']['content']
             except asyncio.TimeoutError:
                 raise OllamaConnectionError(f"AI generation timed out after {timeout} seconds")
+            except Exception:
+                if len(self.hosts) > 1:
+                    self._unhealthy_hosts.add(host)
+                raise
+            finally:
+                self._inflight[host] -= 1
         
         return await self._retry_with_backoff(_do_generate)
     
+    @property
+    def is_healthy(self) -> bool:
+        """
+        Last known health state, kept fresh by the background refresher.
+
+        Endpoints read this flag in O(1) instead of probing Ollama on
+        their own critical path.
+        """
+        return self._connection_healthy
+
+    async def _health_refresher(self) -> None:
+        """Background loop that re-probes Ollama every few seconds."""
+        while True:
+            try:
+                await self.check_connection(force_check=True)
+            except Exception as e:
+                logger.error(f"Background health refresh failed: {e}")
+            await asyncio.sleep(self._refresh_interval)
+
+    def start_health_refresher(self) -> None:
+        """Start the background health refresh task if not already running."""
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._health_refresher())
+
+    async def stop_health_refresher(self) -> None:
+        """Cancel the background health refresh task."""
+        if self._refresher_task is not None:
+            self._refresher_task.cancel()
+            try:
+                await self._refresher_task
+            except asyncio.CancelledError:
+                pass
+            self._refresher_task = None
+
     def is_available(self) -> bool:
         """
         Check if Ollama service is currently available.
@@ -189,8 +505,8 @@ class OllamaService:
             OllamaConnectionError: If Ollama is unavailable
         """
         async def _get_models():
-            client = self._get_client()
-            models = client.list()
+            client = self._get_async_client()
+            models = await client.list()
             return [model['name'] for model in models.get('models', [])]
         
         return await self._retry_with_backoff(_get_models)
@@ -209,6 +525,7 @@ class OllamaService:
             available_models = await self.get_available_models()
             if model_name in available_models:
                 self.model = model_name
+                self._cache_gen += 1  # invalidate cached per-model results
                 logger.info(f"Model set to: {model_name}")
                 return True
             else:
@@ -243,6 +560,13 @@ Task: {task_description}
 
 Respond with only the category name."""
 
+    TASK_CATEGORIZATION_BATCH_PROMPT = """Categorize each of the following tasks into one of these categories: WORK, PERSONAL, HEALTH, FINANCE, LEARNING, SHOPPING, or OTHER.
+
+Tasks (JSON array):
+{descriptions}
+
+Respond with a JSON array of category names in the same order, one per task. JSON array only, no additional text."""
+
     PRIORITY_SUGGESTION_PROMPT = """Suggest a priority level for the following task. Consider the description and due date if provided.
 
 Task: {task_description}
@@ -274,6 +598,50 @@ Provide a better, more specific description that:
 
 Respond with only the improved description."""
 
+    TASK_IMPROVEMENT_BATCH_PROMPT = """Improve each of the following task descriptions to make them more actionable and clear.
+
+Descriptions (JSON array):
+{descriptions}
+
+For every description provide a better, more specific version that:
+- Is clear and actionable
+- Includes specific steps if needed
+- Is concise but comprehensive
+
+Respond with a JSON array of improved descriptions in the same order, one per input. JSON array only, no additional text."""
+
+    # Prompts are static; render them via precompiled segment joins instead
+    # of re-parsing the format string on every call
+    _render_task_generation = staticmethod(_compile_prompt(TASK_GENERATION_PROMPT, 'user_prompt'))
+    _render_categorization = staticmethod(_compile_prompt(TASK_CATEGORIZATION_PROMPT, 'task_description'))
+    _render_categorization_batch = staticmethod(_compile_prompt(TASK_CATEGORIZATION_BATCH_PROMPT, 'descriptions'))
+    _render_priority_suggestion = staticmethod(_compile_prompt(PRIORITY_SUGGESTION_PROMPT, 'task_description', 'due_date'))
+    _render_workload_analysis = staticmethod(_compile_prompt(WORKLOAD_ANALYSIS_PROMPT, 'tasks_summary'))
+    _render_improvement = staticmethod(_compile_prompt(TASK_IMPROVEMENT_PROMPT, 'description'))
+    _render_improvement_batch = staticmethod(_compile_prompt(TASK_IMPROVEMENT_BATCH_PROMPT, 'descriptions'))
+
+    def __init__(self, host: str = "http://localhost:11434", model: str = "llama2",
+                 hosts: Optional[List[str]] = None,
+                 client_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the AI service.
+
+        Args:
+            host: Ollama server host URL
+            model: Default model to use for completions
+            hosts: Optional list of backend host URLs (see OllamaService)
+            client_kwargs: Optional extra keyword arguments forwarded to the
+                underlying httpx client
+        """
+        super().__init__(host=host, model=model, hosts=hosts, client_kwargs=client_kwargs)
+        self._improve_batch_queue = _BatchQueue(self._improve_descriptions_batch)
+        self._categorize_batch_queue = _BatchQueue(self.categorize_tasks_batch)
+        # Duplicate prompts are common (e.g. recurring task titles); cache
+        # successful results for a while so they skip the model entirely
+        self._result_cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+        # Concurrent identical requests share one in-flight generation
+        self._inflight_results: Dict[tuple, asyncio.Future] = {}
+
     async def generate_tasks_from_prompt(self, user_prompt: str) -> List[GeneratedTask]:
         """
         Generate structured tasks from natural language prompt.
@@ -291,43 +659,236 @@ Respond with only the improved description."""
             return []
         
         try:
-            prompt = self.TASK_GENERATION_PROMPT.format(user_prompt=user_prompt.strip())
+            prompt = self._render_task_generation(user_prompt.strip())
             response = await self._generate_completion(prompt)
             
             # Parse JSON response
-            tasks_data = json.loads(response.strip())
-            
+            tasks_data = orjson.loads(response)
+
+            # Fast path: when the model filled in every field, validate the
+            # whole list in one batched pass and skip the per-item loop
+            if isinstance(tasks_data, list) and all(
+                isinstance(td, dict)
+                and td.get('suggested_priority') and td.get('suggested_category')
+                and len(td.get('title') or '') <= 255
+                for td in tasks_data
+            ):
+                try:
+                    return _TASKS_ADAPTER.validate_python(tasks_data)
+                except ValidationError as e:
+                    logger.warning(f"Batched task validation failed, falling back to per-item parsing: {e}")
+
             # Validate and convert to GeneratedTask objects
             generated_tasks = []
+            # (index, needs_category, needs_priority, description, due_date)
+            # for tasks whose annotations the model omitted
+            pending_fill: List[tuple] = []
             for task_data in tasks_data:
+                # Pre-normalize with defaults instead of exception-driven
+                # control flow: omitted fields are common in model output
+                # and shouldn't cost a raised KeyError each
+                if not isinstance(task_data, dict):
+                    logger.warning("Skipping non-object generated task")
+                    continue
+
+                title = str(task_data.get('title') or '').strip()[:255]
+                description = str(task_data.get('description') or '').strip()
+                if not title or not description:
+                    logger.warning("Skipping generated task with empty title or description")
+                    continue
+
+                priority_value = task_data.get('suggested_priority')
+                category_value = task_data.get('suggested_category')
+
                 try:
-                    # Parse due date if provided
-                    due_date = None
-                    if task_data.get('suggested_due_date'):
-                        due_date = datetime.fromisoformat(task_data['suggested_due_date'].replace('Z', '+00:00'))
-                    
-                    task = GeneratedTask(
-                        title=task_data['title'][:255],  # Ensure max length
-                        description=task_data['description'],
-                        suggested_due_date=due_date,
-                        suggested_priority=Priority(task_data['suggested_priority']),
-                        suggested_category=TaskCategory(task_data['suggested_category']),
-                        confidence_score=float(task_data['confidence_score'])
-                    )
-                    generated_tasks.append(task)
-                except (KeyError, ValueError, ValidationError) as e:
+                    task = GeneratedTask.model_validate({
+                        'title': title,
+                        'description': description,
+                        'suggested_due_date': task_data.get('suggested_due_date') or None,
+                        'suggested_priority': priority_value or Priority.MEDIUM,
+                        'suggested_category': category_value or TaskCategory.OTHER,
+                        'confidence_score': task_data.get('confidence_score', 0.5),
+                    })
+                except ValidationError as e:
                     logger.warning(f"Skipping invalid generated task: {e}")
                     continue
-            
+
+                generated_tasks.append(task)
+                if not priority_value or not category_value:
+                    pending_fill.append((
+                        len(generated_tasks) - 1,
+                        not category_value,
+                        not priority_value,
+                        description,
+                        task.suggested_due_date,
+                    ))
+
+            if pending_fill:
+                await self._fill_missing_annotations(generated_tasks, pending_fill)
+
             return generated_tasks
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse AI response as JSON: {e}")
             return []
         except Exception as e:
             logger.error(f"Task generation failed: {e}")
             raise OllamaConnectionError(f"Task generation failed: {e}")
     
+    def _parse_generated_task(self, task_data: Dict[str, Any]) -> Optional[GeneratedTask]:
+        """Build a GeneratedTask from one response object, or None if invalid."""
+        if not isinstance(task_data, dict):
+            return None
+
+        title = str(task_data.get('title') or '').strip()[:255]
+        description = str(task_data.get('description') or '').strip()
+        if not title or not description:
+            return None
+
+        try:
+            return GeneratedTask.model_validate({
+                'title': title,
+                'description': description,
+                'suggested_due_date': task_data.get('suggested_due_date') or None,
+                'suggested_priority': task_data.get('suggested_priority') or Priority.MEDIUM,
+                'suggested_category': task_data.get('suggested_category') or TaskCategory.OTHER,
+                'confidence_score': task_data.get('confidence_score', 0.5),
+            })
+        except ValidationError as e:
+            logger.warning(f"Skipping invalid generated task: {e}")
+            return None
+
+    async def stream_tasks_from_prompt(self, user_prompt: str) -> AsyncIterator[GeneratedTask]:
+        """
+        Generate tasks from a prompt, yielding each one as it completes.
+
+        Streams the model response and parses the JSON array incrementally,
+        so the first task is available after roughly 1/N of the total
+        generation time instead of after the last token.
+
+        Args:
+            user_prompt: Natural language description of tasks needed
+
+        Yields:
+            Generated tasks in response order
+
+        Raises:
+            OllamaConnectionError: If Ollama is unavailable
+        """
+        if not user_prompt.strip():
+            return
+
+        prompt = self._render_task_generation(user_prompt.strip())
+        host = self._pick_host()
+        client = self._get_async_client(host)
+        parser = _JsonArrayParser()
+
+        try:
+            stream = await client.chat(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                stream=True
+            )
+        except Exception as e:
+            raise OllamaConnectionError(f"Task generation failed: {e}")
+
+        async for chunk in stream:
+            content = chunk.get('message', {}).get('content', '')
+            if not content:
+                continue
+            for object_text in parser.feed(content):
+                try:
+                    task_data = orjson.loads(object_text)
+                except orjson.JSONDecodeError as e:
+                    logger.warning(f"Skipping unparseable streamed task: {e}")
+                    continue
+                task = self._parse_generated_task(task_data)
+                if task is not None:
+                    yield task
+
+    async def _fill_missing_annotations(
+        self,
+        generated_tasks: List[GeneratedTask],
+        pending_fill: List[tuple]
+    ) -> None:
+        """
+        Fill omitted category/priority suggestions in one concurrent wave.
+
+        The sub-calls are independent, so they run under a single gather
+        instead of a sequential loop; failures keep the defaults.
+        """
+        coros = []
+        for _, needs_category, needs_priority, description, due_date in pending_fill:
+            if needs_category:
+                coros.append(self.categorize_task(description))
+            if needs_priority:
+                coros.append(self.suggest_priority(description, due_date))
+
+        results = iter(await asyncio.gather(*coros, return_exceptions=True))
+
+        for index, needs_category, needs_priority, _, _ in pending_fill:
+            if needs_category:
+                result = next(results)
+                if isinstance(result, TaskCategory):
+                    generated_tasks[index].suggested_category = result
+            if needs_priority:
+                result = next(results)
+                if isinstance(result, Priority):
+                    generated_tasks[index].suggested_priority = result
+
+    async def annotate_task(
+        self,
+        description: str,
+        due_date: Optional[datetime] = None
+    ) -> Tuple[TaskCategory, Priority]:
+        """
+        Suggest category and priority for a task in one concurrent round.
+
+        The two prompts are independent, so they run under asyncio.gather
+        and the flow pays the latency of the slower one, not the sum.
+
+        Args:
+            description: Description of the task
+            due_date: Optional due date for the task
+
+        Returns:
+            Tuple of (suggested category, suggested priority)
+        """
+        category, priority = await asyncio.gather(
+            self.categorize_task(description),
+            self.suggest_priority(description, due_date),
+        )
+        return category, priority
+
+    async def _single_flight(self, cache_key: tuple, produce):
+        """
+        Coalesce concurrent identical requests onto one in-flight model call.
+
+        The first caller for a key runs the work; callers arriving while it
+        is still running await the same future instead of issuing their own
+        generation. Complements the result cache, which only helps after
+        the first call has completed.
+        """
+        future = self._inflight_results.get(cache_key)
+        if future is not None:
+            return await future
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_results[cache_key] = future
+        try:
+            result = await produce()
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # waiters re-raise; mark retrieved for the no-waiter case
+            raise
+        else:
+            if not future.done():
+                future.set_result(result)
+            return result
+        finally:
+            self._inflight_results.pop(cache_key, None)
+
     async def categorize_task(self, task_description: str) -> TaskCategory:
         """
         Suggest category for a task based on its description.
@@ -343,22 +904,96 @@ Respond with only the improved description."""
         """
         if not task_description.strip():
             return TaskCategory.OTHER
-        
-        try:
-            prompt = self.TASK_CATEGORIZATION_PROMPT.format(task_description=task_description.strip())
-            response = await self._generate_completion(prompt)
-            
-            category_str = response.strip().upper()
+
+        cache_key = ('categorize', self._cache_gen, self.model, task_description.strip())
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async def _produce() -> TaskCategory:
             try:
-                return TaskCategory(category_str)
-            except ValueError:
-                logger.warning(f"Invalid category returned: {category_str}, defaulting to OTHER")
+                prompt = self._render_categorization(task_description.strip())
+                response = await self._generate_completion(prompt)
+
+                category_str = response.strip().upper()
+                try:
+                    category = TaskCategory(category_str)
+                    self._result_cache[cache_key] = category
+                    return category
+                except ValueError:
+                    logger.warning(f"Invalid category returned: {category_str}, defaulting to OTHER")
+                    return TaskCategory.OTHER
+
+            except Exception as e:
+                logger.error(f"Task categorization failed: {e}")
                 return TaskCategory.OTHER
-                
-        except Exception as e:
-            logger.error(f"Task categorization failed: {e}")
-            return TaskCategory.OTHER
+
+        return await self._single_flight(cache_key, _produce)
     
+    async def categorize_task_batched(self, task_description: str) -> TaskCategory:
+        """
+        Categorize a task, coalescing concurrent calls into one prompt.
+
+        Requests arriving within the batching window are combined into a
+        single multi-item model call instead of one round-trip each.
+
+        Args:
+            task_description: Description of the task
+
+        Returns:
+            Suggested task category
+
+        Raises:
+            OllamaConnectionError: If Ollama is unavailable
+        """
+        if not task_description.strip():
+            return TaskCategory.OTHER
+
+        return await self._categorize_batch_queue.submit(task_description)
+
+    async def categorize_tasks_batch(self, descriptions: List[str]) -> List[TaskCategory]:
+        """
+        Categorize several tasks with a single model call.
+
+        One prompt prefill is amortized across the whole batch instead of
+        paying it per description.
+
+        Args:
+            descriptions: Descriptions to categorize, in request order
+
+        Returns:
+            Categories in the same order; OTHER for items the model dropped
+            or mislabeled
+        """
+        if len(descriptions) == 1:
+            return [await self.categorize_task(descriptions[0])]
+
+        try:
+            prompt = self._render_categorization_batch(
+                orjson.dumps([d.strip() for d in descriptions]).decode()
+            )
+            response = await self._generate_completion(prompt)
+            categories = orjson.loads(response)
+
+            if not isinstance(categories, list) or len(categories) != len(descriptions):
+                logger.warning("AI returned mismatched batch categorization, defaulting to OTHER")
+                return [TaskCategory.OTHER] * len(descriptions)
+
+            results = []
+            for category_str in categories:
+                try:
+                    results.append(TaskCategory(str(category_str).strip().upper()))
+                except ValueError:
+                    results.append(TaskCategory.OTHER)
+            return results
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse batched categorization response: {e}")
+            return [TaskCategory.OTHER] * len(descriptions)
+        except Exception as e:
+            logger.error(f"Batched task categorization failed: {e}")
+            return [TaskCategory.OTHER] * len(descriptions)
+
     async def suggest_priority(self, task_description: str, due_date: Optional[datetime] = None) -> Priority:
         """
         Suggest priority level for a task.
@@ -375,25 +1010,35 @@ Respond with only the improved description."""
         """
         if not task_description.strip():
             return Priority.MEDIUM
-        
-        try:
-            due_date_str = due_date.isoformat() if due_date else "Not specified"
-            prompt = self.PRIORITY_SUGGESTION_PROMPT.format(
-                task_description=task_description.strip(),
-                due_date=due_date_str
-            )
-            response = await self._generate_completion(prompt)
-            
-            priority_str = response.strip().upper()
+
+        # Bucket the due date to day precision so near-duplicate timestamps
+        # still share a cache entry
+        due_bucket = due_date.date().isoformat() if due_date else None
+        cache_key = ('priority', self._cache_gen, self.model, task_description.strip(), due_bucket)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async def _produce() -> Priority:
             try:
-                return Priority(priority_str)
-            except ValueError:
-                logger.warning(f"Invalid priority returned: {priority_str}, defaulting to MEDIUM")
+                due_date_str = due_date.isoformat() if due_date else "Not specified"
+                prompt = self._render_priority_suggestion(task_description.strip(), due_date_str)
+                response = await self._generate_completion(prompt)
+
+                priority_str = response.strip().upper()
+                try:
+                    priority = Priority(priority_str)
+                    self._result_cache[cache_key] = priority
+                    return priority
+                except ValueError:
+                    logger.warning(f"Invalid priority returned: {priority_str}, defaulting to MEDIUM")
+                    return Priority.MEDIUM
+
+            except Exception as e:
+                logger.error(f"Priority suggestion failed: {e}")
                 return Priority.MEDIUM
-                
-        except Exception as e:
-            logger.error(f"Priority suggestion failed: {e}")
-            return Priority.MEDIUM
+
+        return await self._single_flight(cache_key, _produce)
     
     async def analyze_workload(self, tasks: List[Dict[str, Any]]) -> WorkloadAnalysis:
         """
@@ -419,50 +1064,105 @@ Respond with only the improved description."""
                 recommendations=["No tasks to analyze. Consider adding some tasks to get started!"]
             )
         
-        # Calculate basic statistics
+        # Calculate all statistics in one pass instead of four separate
+        # walks over the task list
         total_tasks = len(tasks)
-        completed_tasks = sum(1 for task in tasks if task.get('status') == 'COMPLETED')
-        pending_tasks = sum(1 for task in tasks if task.get('status') != 'COMPLETED')
-        
-        # Count overdue tasks
+        completed_tasks = 0
+        overdue_tasks = 0
+        priority_counts: Counter = Counter()
         now = datetime.now()
-        overdue_tasks = sum(
-            1 for task in tasks 
-            if task.get('due_date') and 
-            datetime.fromisoformat(task['due_date'].replace('Z', '+00:00')) < now and
-            task.get('status') != 'COMPLETED'
-        )
-        
-        # Count by priority
+
+        # One C-level conversion to slot structs up front; the loop then
+        # reads fixed attributes instead of hashing dict keys per field
+        for task in msgspec.convert(tasks, List[_TaskRow]):
+            if task.status == 'COMPLETED':
+                completed_tasks += 1
+            elif task.due_date and _parse_iso(task.due_date) < now:
+                overdue_tasks += 1
+            priority_counts[task.priority] += 1
+
+        pending_tasks = total_tasks - completed_tasks
+
+        # Reconcile raw tally into the enum-keyed dict
         tasks_by_priority = {priority: 0 for priority in Priority}
-        for task in tasks:
-            priority = task.get('priority', 'MEDIUM')
+        for priority_str, count in priority_counts.items():
             try:
-                tasks_by_priority[Priority(priority)] += 1
+                tasks_by_priority[Priority(priority_str)] += count
             except ValueError:
-                tasks_by_priority[Priority.MEDIUM] += 1
+                tasks_by_priority[Priority.MEDIUM] += count
         
+        return await self.analyze_workload_from_stats(
+            {
+                'total_tasks': total_tasks,
+                'completed_tasks': completed_tasks,
+                'pending_tasks': pending_tasks,
+                'overdue_tasks': overdue_tasks,
+                'tasks_by_priority': tasks_by_priority,
+            },
+            tasks[:5]
+        )
+
+    async def analyze_workload_from_stats(
+        self,
+        stats: Dict[str, Any],
+        recent_tasks: List[Dict[str, Any]]
+    ) -> WorkloadAnalysis:
+        """
+        Analyze workload from precomputed aggregate statistics.
+
+        Lets callers aggregate counts in SQL instead of shipping the whole
+        task table through Python just to count it.
+
+        Args:
+            stats: Precomputed counts (total/completed/pending/overdue tasks
+                and tasks_by_priority)
+            recent_tasks: Small sample of recent task dicts for prompt context
+
+        Returns:
+            Workload analysis with recommendations
+
+        Raises:
+            OllamaConnectionError: If Ollama is unavailable
+        """
+        total_tasks = stats['total_tasks']
+        completed_tasks = stats['completed_tasks']
+        pending_tasks = stats['pending_tasks']
+        overdue_tasks = stats['overdue_tasks']
+        tasks_by_priority = stats['tasks_by_priority']
+
+        if total_tasks == 0:
+            return WorkloadAnalysis(
+                total_tasks=0,
+                completed_tasks=0,
+                pending_tasks=0,
+                overdue_tasks=0,
+                tasks_by_priority={priority: 0 for priority in Priority},
+                estimated_completion_time=0.0,
+                recommendations=["No tasks to analyze. Consider adding some tasks to get started!"]
+            )
+
         try:
-            # Create summary for AI analysis
-            tasks_summary = f"""
-Total tasks: {total_tasks}
-Completed: {completed_tasks}
-Pending: {pending_tasks}
-Overdue: {overdue_tasks}
-Priority breakdown: {dict(tasks_by_priority)}
-
-Recent tasks:
-"""
-            # Add sample of recent tasks for context
-            for i, task in enumerate(tasks[:5]):
-                tasks_summary += f"- {task.get('title', 'Untitled')}: {task.get('status', 'PENDING')} (Priority: {task.get('priority', 'MEDIUM')})\n"
-            
-            prompt = self.WORKLOAD_ANALYSIS_PROMPT.format(tasks_summary=tasks_summary)
+            # Create summary for AI analysis; join a sample of recent tasks
+            # in one pass instead of growing the string incrementally
+            task_lines = '\n'.join(
+                f"- {task.get('title', 'Untitled')}: {task.get('status', 'PENDING')} (Priority: {task.get('priority', 'MEDIUM')})"
+                for task in recent_tasks[:5]
+            )
+            tasks_summary = (
+                f"\nTotal tasks: {total_tasks}\n"
+                f"Completed: {completed_tasks}\n"
+                f"Pending: {pending_tasks}\n"
+                f"Overdue: {overdue_tasks}\n"
+                f"Priority breakdown: {dict(tasks_by_priority)}\n"
+                f"\nRecent tasks:\n{task_lines}\n"
+            )
+
+            prompt = self._render_workload_analysis(tasks_summary)
             response = await self._generate_completion(prompt)
-            
+
             # Parse AI response
-            ai_data = json.loads(response.strip())
-            
+            ai_data = orjson.loads(response)
+
             return WorkloadAnalysis(
                 total_tasks=total_tasks,
                 completed_tasks=completed_tasks,
@@ -476,8 +1176,8 @@ Recent tasks:
                     "Set realistic deadlines"
                 ])
             )
-            
-        except (json.JSONDecodeError, KeyError) as e:
+
+        except (orjson.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to parse workload analysis response: {e}")
             # Return basic analysis without AI recommendations
             return WorkloadAnalysis(
@@ -512,23 +1212,103 @@ Recent tasks:
         """
         if not description.strip():
             return description
-        
+
+        cache_key = ('improve', self._cache_gen, self.model, description.strip())
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async def _produce() -> str:
+            try:
+                prompt = self._render_improvement(description.strip())
+                response = await self._generate_completion(prompt)
+
+                improved = response.strip()
+                # Ensure we return something reasonable
+                if len(improved) > 10 and len(improved) < 1000:
+                    self._result_cache[cache_key] = improved
+                    return improved
+                else:
+                    logger.warning("AI returned unreasonable task improvement, keeping original")
+                    return description
+
+            except Exception as e:
+                logger.error(f"Task improvement failed: {e}")
+                return description  # Return original on failure
+
+        return await self._single_flight(cache_key, _produce)
+
+    async def improve_task_description_batched(self, description: str) -> str:
+        """
+        Improve a task description, coalescing concurrent calls into one prompt.
+
+        Requests arriving within the batching window are combined into a
+        single multi-item model call instead of one round-trip each.
+
+        Args:
+            description: Current task description
+
+        Returns:
+            Improved task description
+
+        Raises:
+            OllamaConnectionError: If Ollama is unavailable
+        """
+        if not description.strip():
+            return description
+
+        return await self._improve_batch_queue.submit(description)
+
+    async def _improve_descriptions_batch(self, descriptions: List[str]) -> List[str]:
+        """
+        Improve several task descriptions with a single model call.
+
+        Args:
+            descriptions: Descriptions to improve, in request order
+
+        Returns:
+            Improved descriptions in the same order; originals are kept for
+            items the model dropped or mangled
+        """
+        if len(descriptions) == 1:
+            return [await self.improve_task_description(descriptions[0])]
+
         try:
-            prompt = self.TASK_IMPROVEMENT_PROMPT.format(description=description.strip())
+            prompt = self._render_improvement_batch(
+                orjson.dumps([d.strip() for d in descriptions]).decode()
+            )
             response = await self._generate_completion(prompt)
-            
-            improved = response.strip()
-            # Ensure we return something reasonable
-            if len(improved) > 10 and len(improved) < 1000:
-                return improved
-            else:
-                logger.warning("AI returned unreasonable task improvement, keeping original")
-                return description
-                
+            improved = orjson.loads(response)
+
+            if not isinstance(improved, list) or len(improved) != len(descriptions):
+                logger.warning("AI returned mismatched batch improvement, keeping originals")
+                return descriptions
+
+            # Apply the same sanity checks as the single-item path
+            return [
+                new if isinstance(new, str) and 10 < len(new) < 1000 else original
+                for original, new in zip(descriptions, improved)
+            ]
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse batched improvement response: {e}")
+            return descriptions
         except Exception as e:
-            logger.error(f"Task improvement failed: {e}")
-            return description  # Return original on failure
+            logger.error(f"Batched task improvement failed: {e}")
+            return descriptions  # Return originals on failure
 
 
 # Global service instance
-ollama_service = OllamaAIService()
\ No newline at end of file
+@cache
+def get_ollama_service() -> OllamaAIService:
+    """Lazily construct the shared AI service on first use."""
+    from ..core.config import settings
+    return OllamaAIService(host=settings.OLLAMA_HOST, model=settings.OLLAMA_MODEL)
+
+
+def __getattr__(name: str):
+    # Keep `from app.services.ollama_service import ollama_service` working
+    # for older callers without constructing the service at module import
+    if name == 'ollama_service':
+        return get_ollama_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
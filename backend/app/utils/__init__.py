@@ -1,12 +1,12 @@
 """
 Utility functions and helpers.
 """
-from .database import get_db_session, create_task_from_schema, create_chat_message_from_schema
+from .database import create_task_from_schema, create_tasks_from_schemas, create_chat_message_from_schema
 from .validation import validate_task_data, validate_chat_data
 
 __all__ = [
-    "get_db_session",
-    "create_task_from_schema", 
+    "create_task_from_schema",
+    "create_tasks_from_schemas",
     "create_chat_message_from_schema",
     "validate_task_data",
     "validate_chat_data"
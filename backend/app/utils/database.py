@@ -1,14 +1,15 @@
 """
 Database utility functions for model operations.
 """
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.database import Task as TaskModel, ChatMessage as ChatMessageModel
 from app.schemas.task import TaskCreate, TaskUpdate
 from app.schemas.chat import ChatMessageCreate
 
 
-def create_task_from_schema(db: Session, task_data: TaskCreate) -> TaskModel:
+async def create_task_from_schema(db: AsyncSession, task_data: TaskCreate) -> TaskModel:
     """Create a Task database model from a Pydantic schema."""
     db_task = TaskModel(
         title=task_data.title,
@@ -19,29 +20,54 @@ def create_task_from_schema(db: Session, task_data: TaskCreate) -> TaskModel:
         ai_generated=task_data.ai_generated
     )
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    await db.commit()
+    await db.refresh(db_task)
     return db_task
 
 
-def update_task_from_schema(db: Session, db_task: TaskModel, task_update: TaskUpdate) -> TaskModel:
-    """Update a Task database model from a Pydantic schema."""
-    update_data = task_update.dict(exclude_unset=True)
-    
-    for field, value in update_data.items():
-        if field == 'priority' and value is not None:
-            setattr(db_task, field, value.value)
-        elif field == 'status' and value is not None:
-            setattr(db_task, field, value.value)
-        else:
-            setattr(db_task, field, value)
-    
-    db.commit()
-    db.refresh(db_task)
-    return db_task
+async def create_tasks_from_schemas(db: AsyncSession, tasks_data: List[TaskCreate]) -> List[TaskModel]:
+    """Create multiple Task database models in one INSERT batch and commit.
+
+    Unlike looping create_task_from_schema, this issues a single batched
+    INSERT and one commit for the whole list (one fsync instead of N).
+    """
+    db_tasks = [
+        TaskModel(
+            title=task_data.title,
+            description=task_data.description,
+            due_date=task_data.due_date,
+            priority=task_data.priority.value,
+            category=task_data.category,
+            ai_generated=task_data.ai_generated
+        )
+        for task_data in tasks_data
+    ]
+    db.add_all(db_tasks)
+    await db.commit()
+    return db_tasks
+
+
+async def update_task_from_schema(db: AsyncSession, task_id: int, task_update: TaskUpdate) -> Optional[TaskModel]:
+    """Update a Task row from a Pydantic schema with a single UPDATE statement.
+
+    Only the fields actually set on the schema are sent, instead of the
+    full-column UPDATE the per-field setattr approach produced.
+    """
+    values = {
+        field: value.value if field in ('priority', 'status') and value is not None else value
+        for field, value in task_update.model_dump(exclude_unset=True).items()
+    }
 
+    if values:
+        await db.execute(
+            update(TaskModel).where(TaskModel.id == task_id).values(**values)
+        )
+        await db.commit()
 
-def create_chat_message_from_schema(db: Session, message_data: ChatMessageCreate, generated_tasks: Optional[list] = None) -> ChatMessageModel:
+    return await db.get(TaskModel, task_id)
+
+
+async def create_chat_message_from_schema(db: AsyncSession, message_data: ChatMessageCreate, generated_tasks: Optional[list] = None) -> ChatMessageModel:
     """Create a ChatMessage database model from a Pydantic schema."""
     db_message = ChatMessageModel(
         content=message_data.content,
@@ -49,12 +75,6 @@ def create_chat_message_from_schema(db: Session, message_data: ChatMessageCreate
         generated_tasks=generated_tasks
     )
     db.add(db_message)
-    db.commit()
-    db.refresh(db_message)
-    return db_message
-
-
-def get_db_session():
-    """Placeholder for database session dependency."""
-    # This will be implemented when we set up the database connection
-    pass
\ No newline at end of file
+    await db.commit()
+    await db.refresh(db_message)
+    return db_message
\ No newline at end of file
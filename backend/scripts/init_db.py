@@ -11,37 +11,70 @@ import os
 # Add the parent directory to the path so we can import our app
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from app.core.database import create_database, check_database_connection
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.database import create_database
 from app.core.config import settings
+from app.models.database import Base
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _make_probe_engine():
+    """Build an engine with a short connect deadline so a down database fails fast."""
+    connect_args = {}
+    if settings.DATABASE_URL.startswith("postgresql"):
+        connect_args["connect_timeout"] = 3
+    return create_engine(
+        settings.DATABASE_URL,
+        connect_args=connect_args,
+        pool_pre_ping=True,
+    )
+
+
 def init_database():
     """Initialize the database with tables and data."""
     logger.info("Starting database initialization...")
-    
-    # Check database connection
-    if not check_database_connection():
-        logger.error("Cannot connect to database. Please ensure PostgreSQL is running.")
-        logger.error(f"Database URL: {settings.DATABASE_URL}")
-        return False
-    
+
+    # One short-timeout engine serves the probe, the schema check and
+    # create_all, so the TCP+auth handshake is paid once instead of per step
+    engine = _make_probe_engine()
     try:
-        # Create all tables
-        create_database()
-        logger.info("Database tables created successfully!")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error initializing database: {e}")
-        return False
+        # Check database connection with a fast SELECT 1
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.error("Cannot connect to database. Please ensure PostgreSQL is running.")
+            logger.error(f"Database URL: {settings.DATABASE_URL}")
+            logger.error(f"Connection error: {e}")
+            return False
+
+        try:
+            # Skip create_all when every mapped table already exists: one
+            # get_table_names() round trip instead of a per-table existence
+            # probe on every re-run
+            existing_tables = set(inspect(engine).get_table_names())
+            if set(Base.metadata.tables).issubset(existing_tables):
+                logger.info("Database schema is up to date, skipping table creation")
+                return True
+
+            # Create all tables
+            create_database(bind=engine)
+            logger.info("Database tables created successfully!")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error initializing database: {e}")
+            return False
+    finally:
+        engine.dispose()
 
 
 if __name__ == "__main__":
     success = init_database()
     if not success:
         sys.exit(1)
-    
-    logger.info("Database initialization completed successfully!")
\ No newline at end of file
+
+    logger.info("Database initialization completed successfully!")
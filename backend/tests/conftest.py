@@ -0,0 +1,90 @@
+"""
+Shared test helpers and fixtures.
+"""
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="Skip tests marked slow (DB-touching tests) for fast inner-loop runs",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--skip-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="--skip-slow given")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+class StubApiCall:
+    """Terminal step of a stubbed Google API chain; execute() returns a canned result."""
+
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self):
+        return self._result
+
+
+class StubEvents:
+    """Hand-written stand-in for the calendar API's events() resource.
+
+    Plain attribute access and precomputed results instead of MagicMock's
+    per-access child-mock creation; call counters cover the assertions the
+    tests need.
+    """
+
+    def __init__(self, result=None):
+        self._result = result
+        self.patch_calls = 0
+        self.delete_calls = 0
+
+    def insert(self, **kwargs):
+        return StubApiCall(self._result)
+
+    def get(self, **kwargs):
+        return StubApiCall(self._result)
+
+    def update(self, **kwargs):
+        return StubApiCall(self._result)
+
+    def patch(self, **kwargs):
+        self.patch_calls += 1
+        return StubApiCall(self._result)
+
+    def delete(self, **kwargs):
+        self.delete_calls += 1
+        return StubApiCall(None)
+
+    def list(self, **kwargs):
+        return StubApiCall(self._result)
+
+
+class StubCalendarList:
+    """Stand-in for the calendar API's calendarList() resource."""
+
+    def __init__(self, result=None):
+        self._result = result
+
+    def list(self, **kwargs):
+        return StubApiCall(self._result)
+
+
+class StubCalendarAPI:
+    """Stand-in for the googleapiclient service object returned by build()."""
+
+    def __init__(self, events_result=None, calendar_list_result=None):
+        self._events = StubEvents(events_result)
+        self._calendar_list = StubCalendarList(calendar_list_result)
+
+    def events(self):
+        return self._events
+
+    def calendarList(self):
+        return self._calendar_list
@@ -1,89 +1,174 @@
 """
 Tests for database configuration and models.
 """
+import orjson
 import pytest
 from datetime import datetime
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from app.models.database import Base, Task, ChatMessage, Priority, TaskStatus, MessageRole
 
 
-# Create in-memory SQLite database for testing
-@pytest.fixture
-def test_db():
-    """Create a test database session."""
+# Enum string values hoisted once so test bodies don't repeat the
+# descriptor lookup at every call site
+_P_LOW, _P_MED, _P_HIGH, _P_URG = (
+    p.value for p in (Priority.LOW, Priority.MEDIUM, Priority.HIGH, Priority.URGENT)
+)
+_S_PENDING, _S_IN_PROGRESS, _S_COMPLETED = (
+    s.value for s in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED)
+)
+_R_USER = MessageRole.USER.value
+
+# Shared JSON-column payload, built once per module
+_GEN_TASKS = [
+    {
+        "title": "Generated Task 1",
+        "description": "AI generated task",
+        "priority": "MEDIUM"
+    }
+]
+
+
+@pytest.fixture(scope="session")
+def _engine():
+    """In-memory SQLite engine with the schema created once per session.
+
+    Under pytest-xdist each worker is its own process, so this fixture
+    yields one private hot ``:memory:`` database per worker — tests
+    parallelize freely with no cross-worker races and DDL is paid once
+    per worker, not once per test.
+    """
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        # Same orjson codec the app engines use for JSON columns
+        json_serializer=lambda obj: orjson.dumps(obj).decode(),
+        json_deserializer=orjson.loads,
     )
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-    
-    db = TestingSessionLocal()
+
+    # Throwaway test database: trade every durability guarantee for speed
+    @event.listens_for(engine, "connect")
+    def _set_fast_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.executescript(
+            "PRAGMA journal_mode=MEMORY;"
+            "PRAGMA synchronous=OFF;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA locking_mode=EXCLUSIVE;"
+            "PRAGMA cache_size=-20000;"
+        )
+        cursor.close()
+
+    # The database is known empty, so skip create_all's per-table existence
+    # introspection and run the compiled DDL in one executescript
+    ddl_statements = []
+    for table in Base.metadata.sorted_tables:
+        ddl_statements.append(str(CreateTable(table).compile(engine)))
+        ddl_statements.extend(
+            str(CreateIndex(index).compile(engine)) for index in table.indexes
+        )
+    raw = engine.raw_connection()
+    try:
+        raw.driver_connection.executescript(";\n".join(ddl_statements))
+        raw.commit()
+    finally:
+        raw.close()
+
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def _connection(_engine):
+    """One connection shared by every test: no pool checkout per test, and
+    SQLite's page cache stays hot across the whole module."""
+    connection = _engine.connect()
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def test_db(_connection):
+    """Session wrapped in a SAVEPOINT that is rolled back after each test.
+
+    The schema is built once by ``_engine``; per-test isolation comes from
+    an outer transaction plus a nested SAVEPOINT (SQLAlchemy's "join a
+    session into an external transaction" recipe), so a test's commits are
+    discarded without re-running any DDL.
+    """
+    outer = _connection.begin()
+    db = sessionmaker(autocommit=False, autoflush=False, bind=_connection)()
+    nested = _connection.begin_nested()
+
+    @event.listens_for(db, "after_transaction_end")
+    def _restart_savepoint(session, transaction):
+        nonlocal nested
+        if transaction.nested and not transaction._parent.nested:
+            nested = _connection.begin_nested()
+
     try:
         yield db
     finally:
         db.close()
+        outer.rollback()
 
 
+@pytest.mark.slow
 def test_task_model_creation(test_db):
     """Test creating a task model."""
     task = Task(
         title="Test Task",
         description="This is a test task",
-        priority=Priority.HIGH.value,
-        status=TaskStatus.PENDING.value,
+        priority=_P_HIGH,
+        status=_S_PENDING,
         category="Work",
         ai_generated=False
     )
     
     test_db.add(task)
-    test_db.commit()
-    test_db.refresh(task)
+    test_db.flush()
     
     assert task.id is not None
     assert task.title == "Test Task"
     assert task.description == "This is a test task"
-    assert task.priority == Priority.HIGH.value
-    assert task.status == TaskStatus.PENDING.value
+    assert task.priority == _P_HIGH
+    assert task.status == _S_PENDING
     assert task.category == "Work"
     assert task.ai_generated is False
     assert task.created_at is not None
     assert task.updated_at is not None
 
 
+@pytest.mark.slow
 def test_chat_message_model_creation(test_db):
     """Test creating a chat message model."""
     message = ChatMessage(
         content="Hello, can you help me create some tasks?",
-        role=MessageRole.USER.value,
-        generated_tasks=[
-            {
-                "title": "Generated Task 1",
-                "description": "AI generated task",
-                "priority": "MEDIUM"
-            }
-        ]
+        role=_R_USER,
+        generated_tasks=_GEN_TASKS
     )
     
     test_db.add(message)
-    test_db.commit()
-    test_db.refresh(message)
+    test_db.flush()
     
     assert message.id is not None
     assert message.content == "Hello, can you help me create some tasks?"
-    assert message.role == MessageRole.USER.value
+    assert message.role == _R_USER
     assert message.timestamp is not None
     assert message.generated_tasks is not None
     assert len(message.generated_tasks) == 1
     assert message.generated_tasks[0]["title"] == "Generated Task 1"
 
 
+@pytest.mark.slow
 def test_task_model_with_due_date(test_db):
     """Test creating a task with due date."""
     due_date = datetime(2025, 12, 31, 23, 59, 59)
@@ -92,69 +177,63 @@ def test_task_model_with_due_date(test_db):
         title="Year End Task",
         description="Complete before year end",
         due_date=due_date,
-        priority=Priority.URGENT.value,
-        status=TaskStatus.IN_PROGRESS.value
+        priority=_P_URG,
+        status=_S_IN_PROGRESS
     )
     
     test_db.add(task)
-    test_db.commit()
-    test_db.refresh(task)
+    test_db.flush()
     
     assert task.due_date == due_date
-    assert task.priority == Priority.URGENT.value
-    assert task.status == TaskStatus.IN_PROGRESS.value
+    assert task.priority == _P_URG
+    assert task.status == _S_IN_PROGRESS
 
 
+@pytest.mark.slow
 def test_task_model_defaults(test_db):
     """Test task model default values."""
     task = Task(title="Minimal Task")
     
     test_db.add(task)
-    test_db.commit()
-    test_db.refresh(task)
+    test_db.flush()
     
     assert task.title == "Minimal Task"
     assert task.description is None
     assert task.due_date is None
-    assert task.priority == Priority.MEDIUM.value
+    assert task.priority == _P_MED
     assert task.category is None
-    assert task.status == TaskStatus.PENDING.value
+    assert task.status == _S_PENDING
     assert task.calendar_event_id is None
     assert task.ai_generated is False
 
 
-def test_priority_enum_values():
-    """Test priority enum values."""
-    assert Priority.LOW.value == "LOW"
-    assert Priority.MEDIUM.value == "MEDIUM"
-    assert Priority.HIGH.value == "HIGH"
-    assert Priority.URGENT.value == "URGENT"
-
-
-def test_task_status_enum_values():
-    """Test task status enum values."""
-    assert TaskStatus.PENDING.value == "PENDING"
-    assert TaskStatus.IN_PROGRESS.value == "IN_PROGRESS"
-    assert TaskStatus.COMPLETED.value == "COMPLETED"
-
-
-def test_message_role_enum_values():
-    """Test message role enum values."""
-    assert MessageRole.USER.value == "USER"
-    assert MessageRole.ASSISTANT.value == "ASSISTANT"
+@pytest.mark.parametrize("member,expected", [
+    (Priority.LOW, "LOW"),
+    (Priority.MEDIUM, "MEDIUM"),
+    (Priority.HIGH, "HIGH"),
+    (Priority.URGENT, "URGENT"),
+    (TaskStatus.PENDING, "PENDING"),
+    (TaskStatus.IN_PROGRESS, "IN_PROGRESS"),
+    (TaskStatus.COMPLETED, "COMPLETED"),
+    (MessageRole.USER, "USER"),
+    (MessageRole.ASSISTANT, "ASSISTANT"),
+])
+def test_enum_values(member, expected):
+    """Test enum string values across Priority, TaskStatus and MessageRole."""
+    assert member.value == expected
 
 
+@pytest.mark.slow
 def test_task_query_operations(test_db):
     """Test basic query operations on tasks."""
     # Create multiple tasks
     tasks = [
-        Task(title="Task 1", priority=Priority.LOW.value, status=TaskStatus.PENDING.value),
-        Task(title="Task 2", priority=Priority.HIGH.value, status=TaskStatus.COMPLETED.value),
-        Task(title="Task 3", priority=Priority.MEDIUM.value, status=TaskStatus.IN_PROGRESS.value),
+        Task(title="Task 1", priority=_P_LOW, status=_S_PENDING),
+        Task(title="Task 2", priority=_P_HIGH, status=_S_COMPLETED),
+        Task(title="Task 3", priority=_P_MED, status=_S_IN_PROGRESS),
     ]
     
-    for task in tasks:
-        test_db.add(task)
+    test_db.add_all(tasks)
     test_db.commit()
     
     # Query all tasks
@@ -162,11 +241,11 @@ def test_task_query_operations(test_db):
     assert len(all_tasks) == 3
     
     # Query by status
-    pending_tasks = test_db.query(Task).filter(Task.status == TaskStatus.PENDING.value).all()
+    pending_tasks = test_db.query(Task).filter(Task.status == _S_PENDING).all()
     assert len(pending_tasks) == 1
     assert pending_tasks[0].title == "Task 1"
     
     # Query by priority
-    high_priority_tasks = test_db.query(Task).filter(Task.priority == Priority.HIGH.value).all()
+    high_priority_tasks = test_db.query(Task).filter(Task.priority == _P_HIGH).all()
     assert len(high_priority_tasks) == 1
     assert high_priority_tasks[0].title == "Task 2"
\ No newline at end of file
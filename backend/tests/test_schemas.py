@@ -10,6 +10,11 @@ from app.schemas.chat import ChatMessageCreate, ChatPromptRequest, ChatResponse
 from app.schemas.api import ApiResponse, PaginatedResponse, ApiError
 from app.models.database import Priority, TaskStatus, MessageRole
 
+# Generic specializations resolved once; reusing the alias guarantees
+# pydantic's cached generic class is hit instead of re-parameterizing
+StrApiResponse = ApiResponse[str]
+StrPaginatedResponse = PaginatedResponse[str]
+
 
 class TestTaskSchemas:
     """Test task-related schemas."""
@@ -22,7 +27,7 @@ class TestTaskSchemas:
             "priority": Priority.HIGH,
             "category": "Work"
         }
-        task = TaskCreate(**task_data)
+        task = TaskCreate.model_validate(task_data)
         assert task.title == "Test Task"
         assert task.priority == Priority.HIGH
         assert task.ai_generated is False
@@ -34,18 +39,16 @@ class TestTaskSchemas:
         assert task.priority == Priority.MEDIUM
         assert task.ai_generated is False
     
-    def test_task_create_invalid_title(self):
+    @pytest.mark.parametrize("bad_title", ["", "   "])
+    def test_task_create_invalid_title(self, bad_title):
         """Test task creation with invalid title."""
         with pytest.raises(ValidationError):
-            TaskCreate(title="")
-        
-        with pytest.raises(ValidationError):
-            TaskCreate(title="   ")
+            TaskCreate(title=bad_title)
     
     def test_task_update_partial(self):
         """Test partial task update."""
         update_data = {"title": "Updated Title", "priority": Priority.URGENT}
-        task_update = TaskUpdate(**update_data)
+        task_update = TaskUpdate.model_validate(update_data)
         assert task_update.title == "Updated Title"
         assert task_update.priority == Priority.URGENT
         assert task_update.description is None
@@ -70,19 +73,20 @@ class TestTaskSchemas:
             "suggested_category": "AI",
             "confidence_score": 0.85
         }
-        task = GeneratedTask(**task_data)
+        task = GeneratedTask.model_validate(task_data)
         assert task.confidence_score == 0.85
         assert task.suggested_priority == Priority.MEDIUM
     
-    def test_generated_task_invalid_confidence(self):
-        """Test generated task with invalid confidence score."""
+    @pytest.mark.parametrize("bad_score", [-0.1, 1.5, float("nan")])
+    def test_generated_task_invalid_confidence(self, bad_score):
+        """Test generated task with out-of-range confidence scores."""
         with pytest.raises(ValidationError):
             GeneratedTask(
                 title="Test",
                 description="Test",
                 suggested_priority=Priority.LOW,
                 suggested_category="Test",
-                confidence_score=1.5  # Invalid: > 1.0
+                confidence_score=bad_score
             )
 
 
@@ -98,13 +102,11 @@ class TestChatSchemas:
         assert message.content == "Hello, AI!"
         assert message.role == MessageRole.USER
     
-    def test_chat_message_empty_content(self):
+    @pytest.mark.parametrize("bad_content", ["", "   "])
+    def test_chat_message_empty_content(self, bad_content):
         """Test chat message with empty content."""
         with pytest.raises(ValidationError):
-            ChatMessageCreate(content="", role=MessageRole.USER)
-        
-        with pytest.raises(ValidationError):
-            ChatMessageCreate(content="   ", role=MessageRole.USER)
+            ChatMessageCreate(content=bad_content, role=MessageRole.USER)
     
     def test_chat_prompt_request(self):
         """Test chat prompt request."""
@@ -127,7 +129,7 @@ class TestApiSchemas:
     
     def test_api_response(self):
         """Test generic API response."""
-        response = ApiResponse[str](
+        response = StrApiResponse(
             data="test data",
             message="Success",
             success=True
@@ -138,7 +140,7 @@ class TestApiSchemas:
     
     def test_paginated_response(self):
         """Test paginated response."""
-        response = PaginatedResponse[str](
+        response = StrPaginatedResponse(
             items=["item1", "item2"],
             total=10,
             page=1,